@@ -4,7 +4,11 @@ Clean all data from the database and LightRAG storage.
 This removes all decks, slides, and graph data but keeps the schema intact.
 """
 
+import os
+import subprocess
 import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add parent directory to path
@@ -16,6 +20,71 @@ from slidex.core.database import get_db_connection
 import shutil
 
 
+# Upper bound on paths passed to a single `rm -rf`, to stay under ARG_MAX
+_RM_BATCH_SIZE = 512
+
+
+def _fast_rm(*paths: str) -> None:
+    """Remove directory trees, batching them into `rm -rf` calls on POSIX systems."""
+    if os.name == "posix":
+        for start in range(0, len(paths), _RM_BATCH_SIZE):
+            batch = paths[start:start + _RM_BATCH_SIZE]
+            subprocess.run(["rm", "-rf", "--", *batch], check=True)
+    else:
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def _clear_dir(path: Path) -> int:
+    """
+    Remove everything inside a directory but keep the directory itself.
+    
+    Storage directories may be symlinks or mount points, so they are emptied
+    in place rather than removed and recreated. os.scandir() exposes the entry
+    type from the directory listing, avoiding an extra stat() per entry. Files
+    are unlinked directly; subdirectories (one per deck under thumbnails) are
+    collected and removed by a handful of `rm -rf` calls rather than one
+    process per directory.
+    
+    Returns:
+        Number of top-level entries removed
+    """
+    subdirs = []
+    deleted_count = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                os.unlink(entry.path)
+            deleted_count += 1
+    if subdirs:
+        _fast_rm(*subdirs)
+    return deleted_count
+
+
+def _move_to_trash(path: Path) -> bool:
+    """
+    Swap a directory for an empty one and delete the old tree in the background.
+    
+    The directory is renamed to a hidden sibling (an O(1) operation on the same
+    filesystem), recreated empty, and the renamed tree is removed by a detached
+    `rm -rf`, so the caller does not wait for every file to be unlinked.
+    
+    Returns:
+        False if the directory must be emptied in place instead (non-POSIX
+        systems, symlinks and mount points)
+    """
+    if os.name != "posix" or path.is_symlink() or os.path.ismount(path):
+        return False
+    
+    trash = path.parent / f".{path.name}.trash-{uuid.uuid4().hex}"
+    path.rename(trash)
+    path.mkdir(parents=True, exist_ok=True)
+    subprocess.Popen(["rm", "-rf", str(trash)], start_new_session=True)
+    return True
+
+
 def clean_data(confirm: bool = False):
     """Clean all data from database and LightRAG storage."""
     
@@ -40,7 +109,6 @@ def clean_data(confirm: bool = False):
         with get_db_connection() as conn:
             cur = conn.cursor()
             
-            # Delete in order to respect foreign key constraints
             print("\n📊 Cleaning PostgreSQL database...")
             
             # Get counts before deletion
@@ -52,13 +120,15 @@ def clean_data(confirm: bool = False):
             
             print(f"  Found: {decks_count} decks, {slides_count} slides")
             
-            # Delete data (cascades will handle related records)
-            logger.info("Deleting slides...")
-            cur.execute("DELETE FROM slides")
-            print("  ✓ Deleted slides")
+            # The wipe can simply be re-run if it is lost in a crash, so don't
+            # wait for the WAL flush when committing it
+            cur.execute("SET LOCAL synchronous_commit = OFF")
             
-            logger.info("Deleting decks...")
-            cur.execute("DELETE FROM decks")
+            # Truncate both tables in one statement: avoids row-by-row deletes,
+            # per-row FK checks and the table bloat DELETE leaves behind
+            logger.info("Truncating slides and decks...")
+            cur.execute("TRUNCATE TABLE slides, decks RESTART IDENTITY CASCADE")
+            print("  ✓ Deleted slides")
             print("  ✓ Deleted decks")
             
             conn.commit()
@@ -73,48 +143,30 @@ def clean_data(confirm: bool = False):
             lightrag_dir.mkdir(parents=True, exist_ok=True)
             print(f"  ✓ LightRAG storage cleared: {lightrag_dir}")
         
-        # Clean thumbnails
-        logger.info("Cleaning thumbnails...")
-        print("\n🖼️  Cleaning thumbnails...")
-        thumbnails_dir = settings.thumbnails_dir
-        if thumbnails_dir.exists():
-            # Delete all subdirectories (deck folders)
-            for item in thumbnails_dir.iterdir():
-                if item.is_dir():
-                    shutil.rmtree(item)
-            print(f"  ✓ Deleted thumbnails from {thumbnails_dir}")
+        # Clean thumbnails and individual slide files (PPTX and PDF).
+        # The directories are independent and the work is I/O bound, so they
+        # are cleaned concurrently.
+        logger.info("Cleaning thumbnails and individual slide files...")
+        print("\n🖼️  Cleaning thumbnails and individual slide files (PPTX and PDF)...")
+        storage_dirs = {
+            "thumbnail folders": settings.thumbnails_dir,
+            "individual slide files": settings.slides_dir,
+            "individual slide PDF files": settings.slides_pdf_dir,
+        }
+        storage_dirs = {label: path for label, path in storage_dirs.items() if path.exists()}
         
-        # Clean individual slide files (PPTX)
-        logger.info("Cleaning individual slide files...")
-        print("\n📄 Cleaning individual slide files (PPTX)...")
-        slides_dir = settings.slides_dir
-        if slides_dir.exists():
-            # Delete all files and subdirectories
-            deleted_count = 0
-            for item in slides_dir.iterdir():
-                if item.is_dir():
-                    shutil.rmtree(item)
-                    deleted_count += 1
-                elif item.is_file():
-                    item.unlink()
-                    deleted_count += 1
-            print(f"  ✓ Deleted {deleted_count} individual slide files from {slides_dir}")
-        
-        # Clean individual slide files (PDF)
-        logger.info("Cleaning individual slide PDF files...")
-        print("\n📄 Cleaning individual slide files (PDF)...")
-        slides_pdf_dir = settings.slides_pdf_dir
-        if slides_pdf_dir.exists():
-            # Delete all files and subdirectories
-            deleted_count = 0
-            for item in slides_pdf_dir.iterdir():
-                if item.is_dir():
-                    shutil.rmtree(item)
-                    deleted_count += 1
-                elif item.is_file():
-                    item.unlink()
-                    deleted_count += 1
-            print(f"  ✓ Deleted {deleted_count} individual slide PDF files from {slides_pdf_dir}")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {}
+            for label, path in storage_dirs.items():
+                if _move_to_trash(path):
+                    print(f"  ✓ Cleared {label} from {path} (old files are removed in the background)")
+                else:
+                    futures[executor.submit(_clear_dir, path)] = (label, path)
+            
+            for future in as_completed(futures):
+                label, path = futures[future]
+                deleted_count = future.result()
+                print(f"  ✓ Deleted {deleted_count} {label} from {path}")
         
         # Clean audit logs (optional - keeping LLM audit trail)
         # Uncomment if you want to delete audit logs too
@@ -24,18 +24,18 @@ def grant_permissions():
         conn.autocommit = True
         cur = conn.cursor()
         
-        # Grant on existing tables
-        logger.info("Granting permissions on existing tables...")
-        cur.execute("GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA public TO PUBLIC")
-        
-        # Grant on sequences
-        logger.info("Granting permissions on sequences...")
-        cur.execute("GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO PUBLIC")
-        
-        # Grant on future tables
-        logger.info("Setting default privileges for future tables...")
-        cur.execute("ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT, INSERT, UPDATE, DELETE ON TABLES TO PUBLIC")
-        cur.execute("ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT USAGE, SELECT ON SEQUENCES TO PUBLIC")
+        # Existing tables and sequences, plus default privileges for future
+        # ones, in one round-trip. A multi-statement simple query runs as a
+        # single implicit transaction, so the grants apply all-or-nothing.
+        logger.info("Granting permissions on tables and sequences...")
+        cur.execute(
+            """
+            GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA public TO PUBLIC;
+            GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO PUBLIC;
+            ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT SELECT, INSERT, UPDATE, DELETE ON TABLES TO PUBLIC;
+            ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT USAGE, SELECT ON SEQUENCES TO PUBLIC;
+            """
+        )
         
         cur.close()
         conn.close()
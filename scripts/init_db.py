@@ -61,53 +61,53 @@ def run_migrations():
     """
     Run database initialization.
     Prefers consolidated init_schema.sql if available, otherwise runs individual migrations.
+    
+    All SQL is applied in a single transaction that is committed once at the
+    end, so a failing migration rolls the whole initialization back.
     """
     migrations_dir = Path(__file__).parent.parent / "migrations"
     consolidated_schema = migrations_dir / "init_schema.sql"
     
+    # Prefer consolidated schema if it exists
+    if consolidated_schema.exists():
+        logger.info("Using consolidated schema: init_schema.sql")
+        migration_files = [consolidated_schema]
+    else:
+        # Fall back to individual migration files
+        migration_files = sorted([
+            f for f in migrations_dir.glob("*.sql")
+            if f.name.startswith(("001_", "002_", "003_"))
+        ])
+        
+        if not migration_files:
+            logger.warning("No migration files found")
+            return
+        
+        logger.info("Using individual migration files")
+    
+    conn = None
     try:
         conn = psycopg2.connect(settings.database_url)
+        conn.autocommit = False
         cur = conn.cursor()
         
-        # Prefer consolidated schema if it exists
-        if consolidated_schema.exists():
-            logger.info("Using consolidated schema: init_schema.sql")
-            with open(consolidated_schema, "r") as f:
-                sql_content = f.read()
-            
-            cur.execute(sql_content)
-            conn.commit()
-            logger.info("Consolidated schema applied successfully")
-        else:
-            # Fall back to individual migration files
-            migration_files = sorted([
-                f for f in migrations_dir.glob("*.sql")
-                if f.name.startswith(("001_", "002_", "003_"))
-            ])
-            
-            if not migration_files:
-                logger.warning("No migration files found")
-                return
-            
-            logger.info("Using individual migration files")
-            for migration_file in migration_files:
-                logger.info(f"Running migration: {migration_file.name}")
-                
-                with open(migration_file, "r") as f:
-                    sql_content = f.read()
-                
-                cur.execute(sql_content)
-                conn.commit()
-                
-                logger.info(f"Migration {migration_file.name} completed successfully")
+        for migration_file in migration_files:
+            logger.info(f"Running migration: {migration_file.name}")
+            cur.execute(migration_file.read_text())
+            logger.info(f"Migration {migration_file.name} applied")
         
+        conn.commit()
         cur.close()
-        conn.close()
         logger.info("Database initialization completed successfully")
         
     except Exception as e:
+        if conn is not None:
+            conn.rollback()
         logger.error(f"Error running migrations: {e}")
         raise
+    finally:
+        if conn is not None:
+            conn.close()
 
 
 def main():
@@ -117,5 +117,5 @@ echo "2. Make sure Ollama is running: ollama serve"
 echo "3. Pull required models:"
 echo "   - ollama pull nomic-embed-text"
 echo "   - ollama pull granite4:tiny-h"
-echo "4. Start the Flask server: just run"
+echo "4. Start the web server: just run"
 echo "5. Or use the CLI: slidex --help"
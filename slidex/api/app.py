@@ -1,35 +1,66 @@
 """
 FastAPI web application and API for Slidex.
-Migrated from Flask to support async operations with LightRAG.
 """
 
 from fastapi import FastAPI, Request, HTTPException, UploadFile, File, Form, Depends
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
+from urllib.parse import quote
+from email.utils import formatdate, parsedate_to_datetime
+import hashlib
 import json
+import os
+import re
+import stat
 import traceback
 import tempfile
-import shutil
+import threading
 import asyncio
+import time
 import uuid
 
+from pydantic_core import from_json, to_json
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Match, Mount
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from slidex.config import settings
 from slidex.logging_config import logger
 from slidex.core.ingest import ingest_engine
 from slidex.core.search import search_engine
+from slidex.core.search_cache import search_cache
+from slidex.core.ollama_client import ollama_client
 from slidex.core.assembler import slide_assembler
+from slidex.core.pdf_assembler import pdf_assembler
 from slidex.core.database import db
 from slidex.core.graph_visualizer import graph_visualizer
 from slidex.core.deps import get_current_user_optional
-from slidex.api.routers.auth import router as auth_router
+from slidex.api.routers.auth import router as auth_router, prefetch_oauth_metadata
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm per-process caches without delaying startup."""
+    prefetch_task = asyncio.create_task(prefetch_oauth_metadata())
+    yield
+    prefetch_task.cancel()
+
 
 # Initialize FastAPI app
-app = FastAPI(title="Slidex", description="PowerPoint slide management with semantic search")
+app = FastAPI(
+    title="Slidex",
+    description="PowerPoint slide management with semantic search",
+    lifespan=lifespan,
+)
 
 # Add SessionMiddleware for Authlib state management
 app.add_middleware(SessionMiddleware, secret_key=settings.session_secret_key)
@@ -42,11 +73,141 @@ templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templa
 
 # Setup static files
 static_path = Path(__file__).parent.parent / "static"
+static_mount = None
 if static_path.exists():
-    app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
+    static_files = StaticFiles(directory=str(static_path))
+    app.mount("/static", static_files, name="static")
+    static_mount = Mount("/static", app=static_files)
+
+# ============= Read Caches =============
+
+# Decks can also change outside this process (scripts/clean_data.py), so the
+# deck listing is additionally bounded by a short TTL
+DECKS_CACHE_TTL_SECONDS = 30.0
+
+_decks_cache = {"version": None, "expires_at": 0.0, "decks": None, "etag": None}
+# Concurrent misses wait for one refresh instead of each querying the
+# database, and readers never see decks and etag from different refreshes
+_decks_cache_lock = threading.Lock()
+
+# Slide lookups get the same TTL; entries are (data_version, expires_at, slide)
+# in least-recently-used order
+SLIDE_CACHE_TTL_SECONDS = 30.0
+SLIDE_CACHE_MAX_ENTRIES = 4096
+_slide_cache: "OrderedDict[str, Tuple[int, float, dict]]" = OrderedDict()
+_slide_cache_lock = threading.Lock()
+
+
+def _get_slide_cached(slide_id: str, data_version: int) -> Optional[dict]:
+    """
+    Slide lookup served from memory until the next ingest or the TTL expires.
+    
+    Misses (None) are not stored, so a slide ingested by the CLI or another
+    worker is found as soon as it exists.
+    """
+    now = time.monotonic()
+    with _slide_cache_lock:
+        entry = _slide_cache.get(slide_id)
+        if entry is not None and entry[0] == data_version and now < entry[1]:
+            _slide_cache.move_to_end(slide_id)
+            return entry[2]
+    
+    slide = db.get_slide_by_id(slide_id)
+    if slide is not None:
+        with _slide_cache_lock:
+            _slide_cache[slide_id] = (data_version, now + SLIDE_CACHE_TTL_SECONDS, slide)
+            _slide_cache.move_to_end(slide_id)
+            if len(_slide_cache) > SLIDE_CACHE_MAX_ENTRIES:
+                _slide_cache.popitem(last=False)
+    return slide
+
+
+def _get_all_decks_cached() -> Tuple[List[dict], str]:
+    """
+    Deck listing served from memory until the next ingest or the TTL expires.
+    
+    Returns:
+        (decks, etag); decks are never modified after insert, so the set of
+        deck_ids identifies the listing's content
+    """
+    with _decks_cache_lock:
+        version = ingest_engine.data_version
+        now = time.monotonic()
+        if _decks_cache["version"] != version or now >= _decks_cache["expires_at"]:
+            decks = db.get_all_decks()
+            deck_ids = "\n".join(sorted(str(deck["deck_id"]) for deck in decks))
+            _decks_cache["etag"] = f'"{hashlib.sha1(deck_ids.encode()).hexdigest()}"'
+            _decks_cache["decks"] = decks
+            _decks_cache["version"] = version
+            _decks_cache["expires_at"] = now + DECKS_CACHE_TTL_SECONDS
+        return _decks_cache["decks"], _decks_cache["etag"]
+
+
+@lru_cache(maxsize=2)
+def _graph_data_json(graph_version: str) -> bytes:
+    """Serialized /api/graph/data body, built once per graph file version."""
+    return to_json({'success': True, 'graph': graph_visualizer.export_graph_data()})
+
+
+@lru_cache(maxsize=2)
+def _graph_stats_json(graph_version: str) -> bytes:
+    """Serialized /api/graph/stats body, built once per graph file version."""
+    return to_json({'success': True, 'stats': graph_visualizer.get_graph_stats()})
+
+
+# JSON listings that only change on ingest are revalidated rather than re-sent
+REVALIDATE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names this ETag (weak match)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+def _file_validators(stat_result: os.stat_result) -> Dict[str, str]:
+    """ETag and Last-Modified headers for a file, from a single stat()."""
+    return {
+        "ETag": f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"',
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+    }
+
+
+def _is_file_not_modified(request: Request, stat_result: os.stat_result, etag: str) -> bool:
+    """
+    Conditional GET check for a file.
+    
+    If-None-Match wins when present; otherwise If-Modified-Since is compared
+    against the file's mtime (at the one-second resolution of HTTP dates).
+    """
+    if "if-none-match" in request.headers:
+        return _is_not_modified(request, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(stat_result.st_mtime) <= since
+
+
+# LightRAG query modes accepted by /api/search, in the order shown in errors
+SEARCH_MODES = ('naive', 'local', 'global', 'hybrid')
+_VALID_SEARCH_MODES = frozenset(SEARCH_MODES)
+
 
 # ============= Middleware =============
 
+# Paths served without authentication, as whole path segments (so "/auth"
+# matches "/auth/login" but not "/authors"); one compiled match per request
+_AUTH_EXEMPT_PATH = re.compile(r"^(?:/auth|/static|/health|/favicon\.ico)(?:/|$)")
+
+
 @app.middleware("http")
 async def enforce_authentication(request: Request, call_next):
     """
@@ -58,14 +219,7 @@ async def enforce_authentication(request: Request, call_next):
     """
     path = request.url.path
     
-    # Define exempt paths
-    exempt_prefixes = ["/auth", "/static", "/health"]
-    exempt_paths = ["/favicon.ico"]
-    
-    # Check if path is exempt
-    is_exempt = any(path.startswith(prefix) for prefix in exempt_prefixes) or path in exempt_paths
-    
-    if is_exempt:
+    if _AUTH_EXEMPT_PATH.match(path):
         return await call_next(request)
     
     # Check for authenticated user
@@ -84,6 +238,74 @@ async def enforce_authentication(request: Request, call_next):
     return await call_next(request)
 
 
+class StaticShortcutMiddleware:
+    """
+    Serve /static/* directly, ahead of the session and auth middleware.
+    
+    Static assets need neither the session cookie nor a user lookup, so
+    matching requests are handed straight to StaticFiles instead of passing
+    through every middleware layer first.
+    """
+    
+    def __init__(self, app: ASGIApp, mount: Mount):
+        self.app = app
+        self.mount = mount
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            match, child_scope = self.mount.matches(scope)
+            if match == Match.FULL:
+                try:
+                    await self.mount.handle({**scope, **child_scope}, receive, send)
+                except StarletteHTTPException as exc:
+                    # Normally rendered by Starlette's exception middleware
+                    response = PlainTextResponse(
+                        exc.detail, status_code=exc.status_code, headers=exc.headers
+                    )
+                    await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized upload requests from their Content-Length header.
+    
+    Multipart bodies are parsed (and spooled to disk) before the route
+    handler runs, so the limit has to be enforced before the body is read.
+    """
+    
+    def __init__(self, app: ASGIApp, path: str, max_bytes: int):
+        self.app = app
+        self.path = path
+        self.max_bytes = max_bytes
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == self.path:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_bytes:
+                        response = JSONResponse(
+                            status_code=413,
+                            content={"detail": f"Upload exceeds {self.max_bytes // (1024 * 1024)} MB limit"}
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    path="/api/ingest/upload",
+    max_bytes=settings.max_upload_size_mb * 1024 * 1024,
+)
+
+# Added last so it wraps (and runs before) every other middleware
+if static_mount is not None:
+    app.add_middleware(StaticShortcutMiddleware, mount=static_mount)
+
+
 # ============= Web UI Routes =============
 
 @app.get("/", response_class=HTMLResponse)
@@ -101,7 +323,7 @@ async def ingest_page(request: Request, user: Optional[dict] = Depends(get_curre
 @app.get("/decks", response_class=HTMLResponse)
 async def decks_page(request: Request, user: Optional[dict] = Depends(get_current_user_optional)):
     """View all decks."""
-    decks = db.get_all_decks()
+    decks, _ = await asyncio.to_thread(_get_all_decks_cached)
     return templates.TemplateResponse("decks.html", {"request": request, "decks": decks, "user": user})
 
 
@@ -113,14 +335,41 @@ async def graph_page(request: Request, user: Optional[dict] = Depends(get_curren
 
 # ============= API Routes =============
 
+# Sentinel for "body not parsed yet" (a JSON body may itself be null)
+_UNPARSED = object()
+
+
+async def _read_json(request: Request) -> Any:
+    """
+    Parse the request body as JSON.
+    
+    Uses pydantic-core's Rust parser (already a FastAPI dependency) instead
+    of the stdlib json module that Request.json() goes through. The parsed
+    body is memoized on request.state, so repeated calls within a request
+    decode it only once.
+    """
+    parsed = getattr(request.state, "parsed_body", _UNPARSED)
+    if parsed is not _UNPARSED:
+        return parsed
+
+    body = await request.body()
+    try:
+        parsed = from_json(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+
+    request.state.parsed_body = parsed
+    return parsed
+
+
 @app.post("/api/ingest/file")
-async def api_ingest_file(request: Request):
+async def api_ingest_file(request: Request) -> Dict[str, Any]:
     """
     Ingest a single PowerPoint file.
     Body: { "path": "/path/to/file.pptx", "uploader": "optional" }
     """
     try:
-        data = await request.json()
+        data = await _read_json(request)
         
         if not data or 'path' not in data:
             raise HTTPException(status_code=400, detail="Missing required field: path")
@@ -128,7 +377,7 @@ async def api_ingest_file(request: Request):
         file_path = Path(data['path'])
         uploader = data.get('uploader')
         
-        logger.info(f"API: Ingesting file {file_path}")
+        logger.info("API: Ingesting file {}", file_path)
         
         # Run the sync ingest_file in a thread to avoid blocking the event loop
         deck_id = await asyncio.to_thread(
@@ -154,14 +403,44 @@ async def api_ingest_file(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Bounds how many files are ingested at once across all ingest requests.
+# Created inside the serving loop: on Python 3.9 a Semaphore binds to the
+# loop current at construction, which at import time is not uvicorn's
+_ingest_semaphore: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+
+def _get_ingest_semaphore() -> asyncio.Semaphore:
+    """Return the ingest semaphore for the running event loop."""
+    global _ingest_semaphore
+    loop = asyncio.get_running_loop()
+    if _ingest_semaphore is None or _ingest_semaphore[0] is not loop:
+        _ingest_semaphore = (loop, asyncio.Semaphore(max(1, settings.ingest_concurrency)))
+    return _ingest_semaphore[1]
+
+
+async def _ingest_bounded(
+    file_path: Path,
+    uploader: Optional[str],
+    content_sha256: Optional[str] = None
+) -> Optional[str]:
+    """Run the sync ingest_file in a worker thread, bounded by INGEST_CONCURRENCY."""
+    async with _get_ingest_semaphore():
+        return await asyncio.to_thread(
+            ingest_engine.ingest_file,
+            file_path,
+            uploader=uploader,
+            precomputed_sha256=content_sha256
+        )
+
+
 @app.post("/api/ingest/folder")
-async def api_ingest_folder(request: Request):
+async def api_ingest_folder(request: Request) -> Dict[str, Any]:
     """
     Ingest all PowerPoint files in a folder.
     Body: { "path": "/path/to/folder", "recursive": true, "uploader": "optional" }
     """
     try:
-        data = await request.json()
+        data = await _read_json(request)
         
         if not data or 'path' not in data:
             raise HTTPException(status_code=400, detail="Missing required field: path")
@@ -170,16 +449,25 @@ async def api_ingest_folder(request: Request):
         recursive = data.get('recursive', True)
         uploader = data.get('uploader')
         
-        logger.info(f"API: Ingesting folder {folder_path} (recursive={recursive})")
+        logger.info("API: Ingesting folder {} (recursive={})", folder_path, recursive)
+        
+        pptx_files = await asyncio.to_thread(
+            ingest_engine.find_pptx_files, folder_path, recursive
+        )
         
-        # Run the sync ingest_folder in a thread to avoid blocking the event loop
-        deck_ids = await asyncio.to_thread(
-            ingest_engine.ingest_folder,
-            folder_path,
-            recursive=recursive,
-            uploader=uploader
+        # Ingest files concurrently (bounded); one failure doesn't stop the rest
+        outcomes = await asyncio.gather(
+            *(_ingest_bounded(pptx_file, uploader) for pptx_file in pptx_files),
+            return_exceptions=True
         )
         
+        deck_ids = []
+        for pptx_file, outcome in zip(pptx_files, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error ingesting {pptx_file}: {outcome}")
+            elif outcome:
+                deck_ids.append(outcome)
+        
         return {
             'success': True,
             'deck_ids': deck_ids,
@@ -194,87 +482,106 @@ async def api_ingest_folder(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Read/write chunk size for saving uploads (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _write_upload(src, dest: Path) -> str:
+    """
+    Copy an uploaded file's spooled body to dest in large chunks.
+    
+    Returns:
+        Hex SHA-256 of the contents, computed while writing so ingest
+        doesn't have to read the file back to hash it
+    """
+    sha256_hash = hashlib.sha256()
+    with open(dest, 'wb') as buffer:
+        for chunk in iter(lambda: src.read(UPLOAD_CHUNK_SIZE), b""):
+            sha256_hash.update(chunk)
+            buffer.write(chunk)
+    return sha256_hash.hexdigest()
+
+
+async def _save_and_ingest(
+    upload_file: UploadFile,
+    uploads_dir: Path,
+    uploader: Optional[str]
+) -> dict:
+    """Save a single uploaded file to storage and ingest it."""
+    try:
+        # Validate filename exists
+        if not upload_file.filename:
+            return {
+                'filename': 'unknown',
+                'success': False,
+                'message': 'No filename provided'
+            }
+        
+        # Validate file extension
+        if not upload_file.filename.lower().endswith('.pptx'):
+            return {
+                'filename': upload_file.filename,
+                'success': False,
+                'message': 'Only .pptx files are supported'
+            }
+        
+        # Save uploaded file to storage directory
+        # Use a unique name to avoid conflicts
+        unique_filename = f"{uuid.uuid4().hex}_{upload_file.filename}"
+        file_path = uploads_dir / unique_filename
+        
+        # Disk writes run in a worker thread so the event loop stays responsive
+        content_sha256 = await asyncio.to_thread(_write_upload, upload_file.file, file_path)
+        logger.info("Saved uploaded file: {}", file_path)
+        
+        # Ingest the file
+        deck_id = await _ingest_bounded(file_path, uploader, content_sha256)
+        
+        if deck_id:
+            return {
+                'filename': upload_file.filename,
+                'success': True,
+                'deck_id': deck_id,
+                'message': 'File ingested successfully'
+            }
+        return {
+            'filename': upload_file.filename,
+            'success': False,
+            'message': 'File already ingested (duplicate)'
+        }
+            
+    except Exception as e:
+        logger.error(f"Error processing {upload_file.filename}: {e}")
+        logger.error(traceback.format_exc())
+        return {
+            'filename': upload_file.filename,
+            'success': False,
+            'message': str(e)
+        }
+
+
 @app.post("/api/ingest/upload")
 async def api_ingest_upload(
     files: List[UploadFile] = File(...),
     uploader: Optional[str] = Form(None)
-):
+) -> Dict[str, Any]:
     """
     Upload and ingest PowerPoint files via web interface.
-    Supports multiple file uploads.
+    Supports multiple file uploads, which are processed concurrently.
     Files are saved to the configured storage directory.
     """
-    results = []
-    uploaded_files = []
-    
     try:
         # Create uploads directory in storage if it doesn't exist
         uploads_dir = settings.storage_root / "uploads"
         uploads_dir.mkdir(parents=True, exist_ok=True)
         
-        for upload_file in files:
-            try:
-                # Validate filename exists
-                if not upload_file.filename:
-                    results.append({
-                        'filename': 'unknown',
-                        'success': False,
-                        'message': 'No filename provided'
-                    })
-                    continue
-                
-                # Validate file extension
-                if not upload_file.filename.lower().endswith('.pptx'):
-                    results.append({
-                        'filename': upload_file.filename,
-                        'success': False,
-                        'message': 'Only .pptx files are supported'
-                    })
-                    continue
-                
-                # Save uploaded file to storage directory
-                # Use a unique name to avoid conflicts
-                unique_filename = f"{uuid.uuid4().hex}_{upload_file.filename}"
-                file_path = uploads_dir / unique_filename
-                
-                with open(file_path, 'wb') as buffer:
-                    shutil.copyfileobj(upload_file.file, buffer)
-                
-                uploaded_files.append(file_path)
-                logger.info(f"Saved uploaded file: {file_path}")
-                
-                # Ingest the file
-                deck_id = await asyncio.to_thread(
-                    ingest_engine.ingest_file,
-                    file_path,
-                    uploader=uploader
-                )
-                
-                if deck_id:
-                    results.append({
-                        'filename': upload_file.filename,
-                        'success': True,
-                        'deck_id': deck_id,
-                        'message': 'File ingested successfully'
-                    })
-                else:
-                    results.append({
-                        'filename': upload_file.filename,
-                        'success': False,
-                        'message': 'File already ingested (duplicate)'
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error processing {upload_file.filename}: {e}")
-                logger.error(traceback.format_exc())
-                results.append({
-                    'filename': upload_file.filename,
-                    'success': False,
-                    'message': str(e)
-                })
+        # Results keep the order of the uploaded files
+        results = await asyncio.gather(
+            *(_save_and_ingest(upload_file, uploads_dir, uploader) for upload_file in files)
+        )
         
-        # Count successes
-        success_count = sum(1 for r in results if r['success'])
+        # Count successes (bools sum as 0/1; itemgetter keeps the pass in C)
+        success_count = sum(map(itemgetter('success'), results))
         
         return {
             'success': success_count > 0,
@@ -291,7 +598,7 @@ async def api_ingest_upload(
 
 
 @app.post("/api/search")
-async def api_search(request: Request):
+async def api_search(request: Request) -> Dict[str, Any]:
     """Search for slides.
 
     Body: {
@@ -304,7 +611,7 @@ async def api_search(request: Request):
     answer in `lightrag_response` summarizing the query.
     """
     try:
-        data = await request.json()
+        data = await _read_json(request)
         
         if not data or 'query' not in data:
             raise HTTPException(status_code=400, detail="Missing required field: query")
@@ -315,17 +622,33 @@ async def api_search(request: Request):
         mode = data.get('mode', 'hybrid')
         
         # Validate mode
-        valid_modes = ['naive', 'local', 'global', 'hybrid']
-        if mode not in valid_modes:
+        if mode not in _VALID_SEARCH_MODES:
             raise HTTPException(
                 status_code=400,
-                detail=f'Invalid mode. Must be one of: {valid_modes}'
+                detail=f'Invalid mode. Must be one of: {list(SEARCH_MODES)}'
             )
         
-        logger.info(f"API: Searching for '{query}' (top_k={top_k}, mode={mode})")
+        logger.info("API: Searching for '{}' (top_k={}, mode={})", query, top_k, mode)
+        
+        # Semantically similar queries reuse an earlier result instead of
+        # running LightRAG again; the cache is skipped if embedding fails
+        query_embedding = None
+        search_result = None
+        data_version = ingest_engine.data_version
+        if settings.search_cache_enabled and search_cache.is_cacheable(query):
+            try:
+                query_embedding = await asyncio.to_thread(
+                    ollama_client.generate_embedding, query
+                )
+                search_result = search_cache.lookup(query_embedding, top_k, mode, data_version)
+            except Exception as e:
+                logger.warning(f"Search cache unavailable: {e}")
         
         try:
-            search_result = await search_engine.search(query, top_k=top_k, mode=mode)
+            if search_result is None:
+                search_result = await search_engine.search(query, top_k=top_k, mode=mode)
+                if query_embedding is not None and search_result.get('results'):
+                    search_cache.insert(query_embedding, top_k, mode, search_result, data_version)
             results = search_result.get('results', [])
             lightrag_response = search_result.get('response')
         except Exception as e:
@@ -349,10 +672,12 @@ async def api_search(request: Request):
 
 
 @app.get("/api/slide/{slide_id}/preview")
-async def api_slide_preview(slide_id: str):
+async def api_slide_preview(slide_id: str) -> Dict[str, Any]:
     """Get slide preview metadata."""
     try:
-        slide = db.get_slide_by_id(slide_id)
+        slide = await asyncio.to_thread(
+            _get_slide_cached, slide_id, ingest_engine.data_version
+        )
         
         if not slide:
             raise HTTPException(status_code=404, detail="Slide not found")
@@ -369,8 +694,45 @@ async def api_slide_preview(slide_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/slides/batch")
+async def api_slides_batch(request: Request) -> Dict[str, Any]:
+    """Get preview metadata for several slides in one request.
+
+    Body: { "slide_ids": ["id1", "id2"] }
+
+    Slides are returned in request order; unknown ids are omitted.
+    """
+    try:
+        data = await _read_json(request)
+        
+        slide_ids = data.get('slide_ids') if isinstance(data, dict) else None
+        if not isinstance(slide_ids, list):
+            raise HTTPException(status_code=400, detail="slide_ids must be a list")
+        
+        slides = await asyncio.to_thread(db.get_slides_by_ids, slide_ids)
+        return {
+            'success': True,
+            'slides': slides,
+            'count': len(slides)
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"API error getting slides batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _normalize_slide_id(slide_id: Any) -> Optional[str]:
+    """Canonical string form of a slide id, or None if it isn't a UUID."""
+    try:
+        return str(uuid.UUID(str(slide_id)))
+    except ValueError:
+        return None
+
+
 @app.post("/api/assemble")
-async def api_assemble(request: Request):
+async def api_assemble(request: Request) -> Dict[str, Any]:
     """Assemble slides into a new presentation.
 
     The API now always produces **both** PPTX and PDF outputs for simplicity.
@@ -381,7 +743,7 @@ async def api_assemble(request: Request):
     }
     """
     try:
-        data = await request.json()
+        data = await _read_json(request)
         
         if not data or 'slide_ids' not in data:
             raise HTTPException(status_code=400, detail="Missing required field: slide_ids")
@@ -393,20 +755,38 @@ async def api_assemble(request: Request):
         if not isinstance(slide_ids, list) or not slide_ids:
             raise HTTPException(status_code=400, detail="slide_ids must be a non-empty list")
 
-        logger.info(f"API: Assembling {len(slide_ids)} slides into PPTX and PDF")
-
-        # First assemble PPTX
-        pptx_path = slide_assembler.assemble(
-            slide_ids,
-            output_filename=output_filename,
-            preserve_order=preserve_order,
-        )
+        logger.info("API: Assembling {} slides into PPTX and PDF", len(slide_ids))
+
+        # Look every slide up once, up front, and share the rows with both
+        # assemblers; unknown ids fail the request before any work is done
+        slides = await asyncio.to_thread(db.get_slides_by_ids, slide_ids)
+        found_ids = {str(slide['slide_id']) for slide in slides}
+        missing_ids = [
+            slide_id for slide_id in slide_ids
+            if _normalize_slide_id(slide_id) not in found_ids
+        ]
+        if missing_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Slides not found: {', '.join(map(str, missing_ids))}"
+            )
 
-        # Then assemble PDF using per-slide PDFs
-        from slidex.core.pdf_assembler import pdf_assembler
-        pdf_path = pdf_assembler.assemble(
-            slide_ids,
-            preserve_order=preserve_order,
+        # PPTX and PDF (from per-slide PDFs) outputs are independent, so build
+        # them concurrently in worker threads
+        pptx_path, pdf_path = await asyncio.gather(
+            asyncio.to_thread(
+                slide_assembler.assemble,
+                slide_ids,
+                output_filename=output_filename,
+                preserve_order=preserve_order,
+                slides=slides,
+            ),
+            asyncio.to_thread(
+                pdf_assembler.assemble,
+                slide_ids,
+                preserve_order=preserve_order,
+                slides=slides,
+            ),
         )
         
         return {
@@ -425,17 +805,31 @@ async def api_assemble(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Relative paths in stored slide rows are relative to the directory the
+# server was started from; resolve it once at startup. The storage
+# directories themselves are already absolute (Settings.resolve_storage_root).
+# Kept as strings: the download/thumbnail handlers only need os.path joins,
+# which avoid building several Path objects per request
+PROJECT_ROOT = str(Path.cwd().resolve())
+EXPORTS_DIR = str(settings.exports_dir)
+THUMBNAILS_DIR = str(settings.thumbnails_dir)
+_THUMBNAILS_PREFIX = os.path.join(THUMBNAILS_DIR, "")
+
+
 @app.get("/api/download/{filename}")
-async def api_download(filename: str):
-    """Download an assembled presentation."""
+async def api_download(filename: str, request: Request):
+    """Download an assembled presentation (conditional on If-None-Match)."""
     try:
-        # exports_dir is relative to project root
-        file_path = settings.exports_dir
-        if not file_path.is_absolute():
-            file_path = Path.cwd() / file_path
-        file_path = file_path / filename
+        # Only plain file names inside the exports directory can be downloaded
+        if filename in ('.', '..') or os.path.basename(filename) != filename:
+            raise HTTPException(status_code=404, detail="File not found")
+        file_path = os.path.join(EXPORTS_DIR, filename)
 
-        if not file_path.exists():
+        try:
+            stat_result = os.stat(file_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        if not stat.S_ISREG(stat_result.st_mode):
             raise HTTPException(status_code=404, detail="File not found")
 
         # Infer content type
@@ -444,10 +838,37 @@ async def api_download(filename: str):
         else:
             media_type = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
         
+        # Behind nginx, let it send the file with sendfile() and free the worker
+        if settings.download_accel_redirect_prefix:
+            quoted_filename = quote(filename)
+            if quoted_filename != filename:
+                content_disposition = f"attachment; filename*=utf-8''{quoted_filename}"
+            else:
+                content_disposition = f'attachment; filename="{filename}"'
+            accel_prefix = settings.download_accel_redirect_prefix.rstrip('/')
+            return Response(
+                media_type=media_type,
+                headers={
+                    'X-Accel-Redirect': f"{accel_prefix}/{quoted_filename}",
+                    'Content-Disposition': content_disposition,
+                }
+            )
+        
+        # Exports can be re-assembled under the same name, so the ETag
+        # tracks mtime and size; an unchanged file costs only a 304
+        validators = _file_validators(stat_result)
+        if _is_file_not_modified(request, stat_result, validators["ETag"]):
+            return Response(status_code=304, headers=validators)
+        
+        # FileResponse streams from a worker thread in 64 KiB chunks (or via
+        # the server's pathsend extension), without loading the whole file;
+        # reusing our stat result saves it another stat() in a thread
         return FileResponse(
             file_path,
             media_type=media_type,
-            filename=filename
+            filename=filename,
+            headers=validators,
+            stat_result=stat_result,
         )
     
     except HTTPException:
@@ -457,21 +878,48 @@ async def api_download(filename: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Thumbnail files are written once per deck_id and never modified in place
+THUMBNAIL_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
 @app.get("/api/thumbnails/{filepath:path}")
-async def api_thumbnail(filepath: str):
-    """Serve thumbnail images."""
+async def api_thumbnail(filepath: str, request: Request):
+    """Serve thumbnail images with long-lived caching and ETag revalidation."""
     try:
-        # Filepath from database is already relative to project root
-        thumbnail_path = Path(filepath)
+        # Filepath from database is relative to project root (or absolute);
+        # normalize lexically and refuse anything outside the thumbnails dir
+        thumbnail_path = os.path.normpath(os.path.join(PROJECT_ROOT, filepath))
+        if not thumbnail_path.startswith(_THUMBNAILS_PREFIX):
+            raise HTTPException(status_code=404, detail="Thumbnail not found")
         
-        # If it's not absolute, make it relative to project root
-        if not thumbnail_path.is_absolute():
-            thumbnail_path = Path.cwd() / thumbnail_path
+        # Behind nginx, only the auth and path checks run in Python; nginx
+        # serves the bytes (and handles conditional requests) itself
+        if settings.thumbnail_accel_redirect_prefix:
+            relative_path = thumbnail_path[len(_THUMBNAILS_PREFIX):]
+            accel_prefix = settings.thumbnail_accel_redirect_prefix.rstrip('/')
+            return Response(
+                media_type='image/png',
+                headers={
+                    'X-Accel-Redirect': f"{accel_prefix}/{quote(relative_path)}",
+                    'Cache-Control': THUMBNAIL_CACHE_CONTROL,
+                }
+            )
         
-        if not thumbnail_path.exists():
+        try:
+            stat_result = os.stat(thumbnail_path)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Thumbnail not found")
         
-        return FileResponse(thumbnail_path, media_type='image/png')
+        cache_headers = {"Cache-Control": THUMBNAIL_CACHE_CONTROL, **_file_validators(stat_result)}
+        if _is_file_not_modified(request, stat_result, cache_headers["ETag"]):
+            return Response(status_code=304, headers=cache_headers)
+        
+        return FileResponse(
+            thumbnail_path,
+            media_type='image/png',
+            headers=cache_headers,
+            stat_result=stat_result,
+        )
     
     except HTTPException:
         raise
@@ -481,10 +929,14 @@ async def api_thumbnail(filepath: str):
 
 
 @app.get("/api/decks")
-async def api_get_decks():
+async def api_get_decks(request: Request, response: Response) -> Dict[str, Any]:
     """Get all decks."""
     try:
-        decks = db.get_all_decks()
+        decks, etag = await asyncio.to_thread(_get_all_decks_cached)
+        cache_headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+        if _is_not_modified(request, etag):
+            return Response(status_code=304, headers=cache_headers)
+        response.headers.update(cache_headers)
         return {
             'success': True,
             'decks': decks,
@@ -496,17 +948,23 @@ async def api_get_decks():
 
 
 @app.get("/api/graph/data")
-async def api_graph_data():
+async def api_graph_data(request: Request):
     """Get knowledge graph data for visualization."""
     try:
         if not settings.lightrag_enabled:
             raise HTTPException(status_code=400, detail="LightRAG is not enabled")
         
-        graph_data = graph_visualizer.export_graph_data()
-        return {
-            'success': True,
-            'graph': graph_data
-        }
+        # Revalidate against the graph file before parsing it
+        graph_version = graph_visualizer.graph_version()
+        etag = f'"graph-{graph_version}"'
+        cache_headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+        if _is_not_modified(request, etag):
+            return Response(status_code=304, headers=cache_headers)
+        
+        # The graph is parsed and serialized once per version; later requests
+        # get the cached bytes without touching the export or the encoder
+        body = await asyncio.to_thread(_graph_data_json, graph_version)
+        return Response(content=body, media_type="application/json", headers=cache_headers)
     
     except HTTPException:
         raise
@@ -516,17 +974,20 @@ async def api_graph_data():
 
 
 @app.get("/api/graph/stats")
-async def api_graph_stats():
+async def api_graph_stats(request: Request):
     """Get knowledge graph statistics."""
     try:
         if not settings.lightrag_enabled:
             raise HTTPException(status_code=400, detail="LightRAG is not enabled")
         
-        stats = graph_visualizer.get_graph_stats()
-        return {
-            'success': True,
-            'stats': stats
-        }
+        graph_version = graph_visualizer.graph_version()
+        etag = f'"graph-stats-{graph_version}"'
+        cache_headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+        if _is_not_modified(request, etag):
+            return Response(status_code=304, headers=cache_headers)
+        
+        body = await asyncio.to_thread(_graph_stats_json, graph_version)
+        return Response(content=body, media_type="application/json", headers=cache_headers)
     
     except HTTPException:
         raise
@@ -536,16 +997,21 @@ async def api_graph_stats():
 
 
 @app.get("/health")
-async def health():
+async def health() -> Dict[str, Any]:
     """Health check endpoint."""
     return {'status': 'healthy', 'service': 'slidex'}
 
 
 if __name__ == '__main__':
     import uvicorn
+    # uvicorn picks uvloop and httptools automatically when they are installed
+    # (e.g. via uvicorn[standard]); multiple workers need the app import string
     uvicorn.run(
-        app,
+        "slidex.api.app:app" if settings.server_workers > 1 else app,
         host=settings.server_host,
-        port=settings.server_port
+        port=settings.server_port,
+        workers=settings.server_workers,
+        loop="auto",
+        http="auto",
     )
 
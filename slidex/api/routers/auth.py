@@ -2,6 +2,8 @@
 Authentication router for Google SSO.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Request, Response, HTTPException, Depends
 from fastapi.responses import RedirectResponse, JSONResponse
 from authlib.integrations.starlette_client import OAuth
@@ -35,6 +37,24 @@ else:
     logger.warning("Google OAuth credentials not configured. SSO will not work.")
 
 
+async def prefetch_oauth_metadata() -> None:
+    """
+    Fetch Google's discovery document and signing keys before the first login.
+    
+    authlib keeps both in memory once loaded, so logins skip the two HTTPS
+    round-trips. On failure authlib simply fetches them lazily as before.
+    """
+    google = oauth.create_client('google')
+    if not google:
+        return
+    try:
+        # fetch_jwk_set loads the server metadata first
+        await asyncio.wait_for(google.fetch_jwk_set(), timeout=10)
+        logger.debug("Google OAuth metadata prefetched")
+    except Exception as e:
+        logger.warning(f"Could not prefetch Google OAuth metadata: {e}")
+
+
 @router.get("/login")
 async def login(request: Request):
     """Redirect to Google for authentication."""
@@ -62,11 +82,11 @@ async def auth_callback(request: Request):
         if not user_info:
              raise ValueError("Could not retrieve user info")
              
-        # Create or update user
-        user = auth_service.create_or_update_user(user_info)
+        # Create or update user (database calls run off the event loop)
+        user = await asyncio.to_thread(auth_service.create_or_update_user, user_info)
         
         # Create session
-        session_id = auth_service.create_session(str(user['user_id']))
+        session_id = await asyncio.to_thread(auth_service.create_session, str(user['user_id']))
         
         # Determine redirect URL (could be stored in state, default to root for now)
         response = RedirectResponse(url="/")
@@ -109,7 +129,7 @@ async def logout(
     # Remove session from DB
     session_id = request.cookies.get("session_id")
     if session_id:
-        auth_service.delete_session(session_id)
+        await asyncio.to_thread(auth_service.delete_session, session_id)
     
     # Clear cookie
     response.delete_cookie("session_id")
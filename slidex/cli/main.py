@@ -5,13 +5,14 @@ CLI interface for Slidex using Typer.
 import typer
 from pathlib import Path
 from typing import Optional, List
-import json
+import asyncio
 import sys
+from pydantic_core import to_json
 
 from slidex.logging_config import logger
-from slidex.core.ingest import ingest_engine
-from slidex.core.search import search_engine
-from slidex.core.assembler import slide_assembler
+
+# The engines (python-pptx, LightRAG, Ollama, database pool) are imported
+# inside the commands that use them, so `--help` and `version` start fast
 
 
 app = typer.Typer(
@@ -23,6 +24,10 @@ app = typer.Typer(
 ingest_app = typer.Typer(help="Ingest PowerPoint files")
 app.add_typer(ingest_app, name="ingest")
 
+# LightRAG query modes, in the order shown in error messages
+SEARCH_MODES = ('naive', 'local', 'global', 'hybrid')
+_VALID_SEARCH_MODES = frozenset(SEARCH_MODES)
+
 
 @ingest_app.command("file")
 def ingest_file(
@@ -30,6 +35,8 @@ def ingest_file(
     uploader: Optional[str] = typer.Option(None, help="Uploader name"),
 ):
     """Ingest a single PowerPoint file."""
+    from slidex.core.ingest import ingest_engine
+    
     try:
         file_path = Path(path)
         typer.echo(f"Ingesting file: {file_path}")
@@ -57,8 +64,13 @@ def ingest_folder(
     path: str = typer.Argument(..., help="Path to the folder"),
     recursive: bool = typer.Option(True, help="Search recursively"),
     uploader: Optional[str] = typer.Option(None, help="Uploader name"),
+    workers: Optional[int] = typer.Option(
+        None, help="Files to ingest concurrently (default: INGEST_CONCURRENCY)"
+    ),
 ):
     """Ingest all PowerPoint files in a folder."""
+    from slidex.core.ingest import ingest_engine
+    
     try:
         folder_path = Path(path)
         typer.echo(f"Ingesting folder: {folder_path} (recursive={recursive})")
@@ -66,7 +78,8 @@ def ingest_folder(
         deck_ids = ingest_engine.ingest_folder(
             folder_path,
             recursive=recursive,
-            uploader=uploader
+            uploader=uploader,
+            max_workers=workers
         )
         
         typer.secho(
@@ -87,27 +100,32 @@ def search(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ):
     """Search for slides using semantic search with LightRAG."""
+    from slidex.core.search import search_engine
+    
     try:
         # Validate mode
-        valid_modes = ['naive', 'local', 'global', 'hybrid']
-        if mode not in valid_modes:
+        if mode not in _VALID_SEARCH_MODES:
             typer.secho(
-                f"Invalid mode '{mode}'. Must be one of: {', '.join(valid_modes)}",
+                f"Invalid mode '{mode}'. Must be one of: {', '.join(SEARCH_MODES)}",
                 fg=typer.colors.RED, err=True
             )
             raise typer.Exit(code=1)
         
         typer.echo(f"Searching for: '{query}' (mode={mode})")
         
-        results = search_engine.search(query, top_k=top_k, mode=mode)
+        search_result = asyncio.run(search_engine.search(query, top_k=top_k, mode=mode))
+        results = search_result.get('results', [])
         
         if not results:
             typer.secho("No results found.", fg=typer.colors.YELLOW)
             return
         
         if json_output:
-            # Output as JSON
-            print(json.dumps(results, indent=2, default=str))
+            # Output as JSON, encoded straight to bytes (no intermediate str)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(to_json(results, indent=2, fallback=str))
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
         else:
             # Human-readable output
             typer.secho(f"\nFound {len(results)} results:\n", fg=typer.colors.GREEN)
@@ -132,6 +150,8 @@ def assemble(
     preserve_order: bool = typer.Option(False, "--preserve-order", help="Preserve slide order"),
 ):
     """Assemble selected slides into a new presentation."""
+    from slidex.core.assembler import slide_assembler
+    
     try:
         # Parse slide IDs
         slide_id_list = [s.strip() for s in slide_ids.split(",")]
@@ -5,9 +5,9 @@ All settings can be overridden via environment variables or config/dev.yaml
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,11 +21,22 @@ class Settings(BaseSettings):
         extra="ignore",
     )
     
+    # Storage directories already created by _storage_dir
+    _dirs_ready: set = PrivateAttr(default_factory=set)
+    
     # Database
     database_url: str = Field(
         default="postgresql://localhost:5432/slidex",
         description="PostgreSQL connection URL"
     )
+    database_pool_min_connections: int = Field(
+        default=1,
+        description="Minimum number of pooled PostgreSQL connections"
+    )
+    database_pool_max_connections: int = Field(
+        default=8,
+        description="Maximum number of pooled PostgreSQL connections"
+    )
 
     # Authentication
     google_client_id: Optional[str] = Field(default=None, description="Google OAuth Client ID")
@@ -38,6 +49,10 @@ class Settings(BaseSettings):
         default=86400, # 24 hours
         description="Session expiration time in seconds"
     )
+    api_keys: Dict[str, str] = Field(
+        default_factory=dict,
+        description="API keys for server-to-server access, as {name: key}"
+    )
     
     # Ollama configuration
     ollama_host: str = Field(default="http://localhost", description="Ollama host URL")
@@ -50,6 +65,10 @@ class Settings(BaseSettings):
         default="granite4:tiny-h",
         description="Ollama LLM model for summarization"
     )
+    ollama_max_concurrency: int = Field(
+        default=4,
+        description="Maximum number of concurrent Ollama requests during ingestion"
+    )
     
     # Storage paths
     storage_root: Path = Field(
@@ -98,6 +117,11 @@ class Settings(BaseSettings):
         default="/Applications/LibreOffice.app/Contents/MacOS/soffice",
         description="Path to LibreOffice executable for PDF conversion"
     )
+    libreoffice_pool_size: int = Field(
+        default=2,
+        description="Number of LibreOffice conversions run in parallel, "
+                    "each with its own persistent user profile"
+    )
     pdf_dpi: int = Field(
         default=150,
         description="DPI for PDF rendering (higher = better quality, larger file)"
@@ -115,6 +139,34 @@ class Settings(BaseSettings):
     batch_size: int = Field(default=10, description="Batch size for processing")
     thumbnail_width: int = Field(default=426, description="Thumbnail width in pixels")
     top_k_results: int = Field(default=10, description="Default number of search results")
+    ingest_concurrency: int = Field(
+        default=2,
+        description="Maximum number of files ingested concurrently by the API"
+    )
+    assembly_workers: int = Field(
+        default=4,
+        description="Source presentations parsed concurrently when assembling a deck"
+    )
+    assembly_cache_size: int = Field(
+        default=16,
+        description="Parsed source presentations kept in memory between assemblies"
+    )
+    search_cache_enabled: bool = Field(
+        default=True,
+        description="Serve semantically similar repeat queries from an in-memory cache"
+    )
+    search_cache_similarity_threshold: float = Field(
+        default=0.95,
+        description="Minimum cosine similarity between queries for a search cache hit"
+    )
+    search_cache_max_entries: int = Field(
+        default=1000,
+        description="Maximum number of queries held in the search cache"
+    )
+    search_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="Seconds a cached search result is served before it is recomputed"
+    )
     
     # Logging
     log_level: str = Field(default="DEBUG", description="Logging level")
@@ -123,35 +175,74 @@ class Settings(BaseSettings):
     server_host: str = Field(default="0.0.0.0", description="Server host address")
     server_port: int = Field(default=5001, description="Server port")
     server_debug: bool = Field(default=True, description="Debug mode")
+    server_workers: int = Field(
+        default=1,
+        description="Number of Uvicorn worker processes"
+    )
+    max_upload_size_mb: int = Field(
+        default=200,
+        description="Maximum request body size for file uploads, in megabytes"
+    )
+    download_accel_redirect_prefix: Optional[str] = Field(
+        default=None,
+        description="Internal nginx location for exports; when set, downloads are "
+                    "handed to nginx via X-Accel-Redirect"
+    )
+    thumbnail_accel_redirect_prefix: Optional[str] = Field(
+        default=None,
+        description="Internal nginx location for thumbnails; when set, thumbnails are "
+                    "handed to nginx via X-Accel-Redirect after the auth check"
+    )
     
     @property
     def ollama_base_url(self) -> str:
         """Full Ollama base URL."""
         return f"{self.ollama_host}:{self.ollama_port}"
     
+    def _storage_dir(self, name: str) -> Path:
+        """Directory under storage_root, created the first time it is used."""
+        path = self.storage_root / name
+        if path not in self._dirs_ready:
+            path.mkdir(parents=True, exist_ok=True)
+            self._dirs_ready.add(path)
+        return path
+    
     @property
     def thumbnails_dir(self) -> Path:
         """Thumbnails storage directory."""
-        return self.storage_root / "thumbnails"
+        return self._storage_dir("thumbnails")
     
     @property
     def slides_dir(self) -> Path:
         """Individual slides storage directory (PPTX)."""
-        return self.storage_root / "slides"
+        return self._storage_dir("slides")
     
     @property
     def slides_pdf_dir(self) -> Path:
         """Individual slides PDF storage directory."""
-        return self.storage_root / "slides_pdf"
+        return self._storage_dir("slides_pdf")
     
     @property
     def exports_dir(self) -> Path:
         """Exports storage directory."""
-        return self.storage_root / "exports"
+        return self._storage_dir("exports")
+    
+    def resolve_storage_root(self) -> None:
+        """
+        Make storage_root absolute, so the derived directories need no
+        cwd/symlink lookups when used. Creates nothing.
+        """
+        self.storage_root = self.storage_root.resolve()
     
     def ensure_directories(self) -> None:
-        """Ensure all required directories exist."""
+        """
+        Ensure all required directories exist.
+        
+        Not needed in normal operation: the storage directories are created
+        on first use and every writer creates its own parent directory.
+        """
         self.storage_root.mkdir(parents=True, exist_ok=True)
+        self.resolve_storage_root()
         self.thumbnails_dir.mkdir(parents=True, exist_ok=True)
         self.slides_dir.mkdir(parents=True, exist_ok=True)
         if self.pdf_conversion_enabled:
@@ -166,4 +257,4 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
-settings.ensure_directories()
+settings.resolve_storage_root()
@@ -2,20 +2,144 @@
 Slide assembler for creating new PowerPoint presentations from selected slides.
 """
 
+import os
+import tempfile
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 from pptx import Presentation
 from pptx.parts.image import Image, ImagePart
 from pptx.opc.package import Part
-from copy import deepcopy
-from pptx.oxml.ns import qn
+from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+from copy import copy
+from lxml import etree
+from pptx.oxml.ns import nsuri, qn
 import io
 
 from slidex.config import settings
 from slidex.logging_config import logger
 from slidex.core.database import db
 
+# Relationship-id attributes remapped in copied slide XML
+_R_EMBED = qn('r:embed')
+_R_ID = qn('r:id')
+_R_LINK = qn('r:link')
+_REL_ATTRS = (_R_EMBED, _R_ID, _R_LINK)
+_P_EXTLST = qn('p:extLst')
+# Only the nodes that carry one of them, found in one libxml2 traversal
+# (descendant-or-self, so the search stays inside the copied element)
+_REMAP_XPATH = etree.XPath(
+    "descendant-or-self::*[@r:embed or @r:id or @r:link]",
+    namespaces={'r': nsuri('r')},
+)
+
+
+@lru_cache(maxsize=max(0, settings.assembly_cache_size))
+def _parse_presentation(path: str, mtime_ns: int) -> Presentation:
+    """
+    Parse a source presentation, shared across assemblies.
+    
+    Keyed by modification time, so a deck replaced on disk is parsed
+    again. Assembly only reads the sources (shapes are cloned, parts are
+    read at save), so one parsed copy can serve concurrent requests.
+    """
+    return Presentation(path)
+
+
+@lru_cache(maxsize=None)
+def _reltype_kind(reltype: str) -> str:
+    """
+    Classify a relationship type as 'skip', 'image', 'ole', 'media' or 'other'.
+    
+    There are only a handful of distinct reltypes, so each is classified
+    once and every later relationship is a cache lookup.
+    """
+    reltype_lower = reltype.lower()
+    # Internal PPTX structure relationships (layouts, masters, themes) belong
+    # to the presentation template and are not copied
+    if any(skip in reltype_lower for skip in (
+        'slidelayout', 'slidemaster', 'theme', 'notesmaster', 'notesslide', 'handoutmaster'
+    )):
+        return 'skip'
+    if 'image' in reltype_lower:
+        return 'image'
+    if 'oleobject' in reltype_lower or 'package' in reltype_lower or 'embeddings' in reltype_lower:
+        return 'ole'
+    if 'media' in reltype_lower or 'video' in reltype_lower or 'audio' in reltype_lower:
+        return 'media'
+    return 'other'
+
+
+# Part extensions whose content is already compressed; deflating them again
+# costs CPU for no size gain, so they are stored as-is in the saved package
+_PRECOMPRESSED_EXTS = frozenset({
+    'png', 'jpg', 'jpeg', 'gif', 'wdp',
+    'mp4', 'm4v', 'mov', 'wmv', 'mp3', 'm4a', 'wma',
+    'docx', 'xlsx', 'xlsm', 'pptx', 'zip',
+})
+
+
+# mkstemp creates files as 0600; exports get the mode a plain open() would
+# give them, so nginx (X-Accel-Redirect) and other users can read them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_EXPORT_FILE_MODE = 0o666 & ~_UMASK
+
+
+# Content type fallback and part name stem for parts copied by _copy_part
+_COPIED_PART_TYPES = {
+    'ole': ('application/vnd.openxmlformats-officedocument.oleObject', '/ppt/embeddings/oleObject'),
+    'media': ('application/octet-stream', '/ppt/media/media'),
+    'other': ('application/octet-stream', '/ppt/other/object'),
+}
+
+
+class _ZipWriter(_ZipPkgWriter):
+    """Package zip writer that stores already-compressed media uncompressed."""
+    
+    def write(self, pack_uri: PackURI, blob: bytes) -> None:
+        if pack_uri.ext.lower() not in _PRECOMPRESSED_EXTS:
+            super().write(pack_uri, blob)
+            return
+        zinfo = zipfile.ZipInfo(pack_uri.membername, date_time=time.localtime()[:6])
+        zinfo.compress_type = zipfile.ZIP_STORED
+        zinfo.external_attr = 0o600 << 16
+        self._zipf.writestr(zinfo, blob)
+
+
+class _PackageWriter(PackageWriter):
+    """python-pptx's PackageWriter, writing through _ZipWriter."""
+    
+    def _write(self) -> None:
+        with _ZipWriter(self._pkg_file) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+
+class _LazyPart(Part):
+    """
+    Copy of a source part whose bytes are only read when the package is saved.
+    
+    Large embedded media and OLE payloads are not materialized a second
+    time while the presentation is assembled; the source presentation must
+    stay loaded until save.
+    """
+    
+    def __init__(self, partname: str, content_type: str, package, source_part):
+        super().__init__(PackURI(partname), content_type, package)
+        self._source_part = source_part
+    
+    @property
+    def blob(self) -> bytes:
+        return self._source_part.blob
+
 
 class SlideAssembler:
     """Assembles selected slides into a new PowerPoint presentation."""
@@ -25,6 +149,7 @@ class SlideAssembler:
         slide_ids: List[str],
         output_filename: Optional[str] = None,
         preserve_order: bool = False,
+        slides: Optional[List[dict]] = None,
     ) -> Path:
         """Assemble slides into a new PowerPoint presentation.
 
@@ -33,43 +158,48 @@ class SlideAssembler:
             output_filename: Optional output filename (generated if not provided)
             preserve_order: If True, preserve the order of slide_ids;
                             otherwise order by original deck order
+            slides: Slide rows already fetched with db.get_slides_by_ids,
+                    in slide_ids order (skips the lookup)
         """
         if not slide_ids:
             raise ValueError("No slides provided for assembly")
 
         logger.info(f"Assembling presentation with {len(slide_ids)} slides (PPTX)")
         
-        # Fetch slide metadata
-        slides_data = []
-        for slide_id in slide_ids:
-            slide = db.get_slide_by_id(slide_id)
-            if not slide:
-                logger.warning(f"Slide not found: {slide_id}, skipping")
-                continue
-            slides_data.append(slide)
+        # Fetch slide metadata (one query for all slides) unless preloaded
+        slides_data = slides if slides is not None else db.get_slides_by_ids(slide_ids)
+        if len(slides_data) < len(slide_ids):
+            logger.warning(
+                f"{len(slide_ids) - len(slides_data)} slide(s) not found, skipping"
+            )
         
         if not slides_data:
             raise ValueError("No valid slides found")
         
-        # Determine the most common slide dimensions to use for the output
-        dimensions_count = {}
+        # Load every source slide once; the same objects are used for the
+        # dimension vote and for copying, so no file is parsed twice, and
+        # each file is stat()ed once (existence check and cache key alike)
+        mtimes = {}
+        prs_cache = SlideAssembler._prefetch_presentations(slides_data, mtimes)
+        source_slides = {}
+        dimensions_count = Counter()
         for slide_data in slides_data:
-            slide_file_path = slide_data.get('slide_file_path')
             try:
-                if slide_file_path and Path(slide_file_path).exists():
-                    temp_prs = Presentation(slide_file_path)
-                else:
-                    deck_path = slide_data['deck_path']
-                    temp_prs = Presentation(deck_path)
-                
-                dim = (temp_prs.slide_width, temp_prs.slide_height)
-                dimensions_count[dim] = dimensions_count.get(dim, 0) + 1
-            except Exception:
-                pass
+                source_prs, source_slide = SlideAssembler._load_source_slide(
+                    slide_data, prs_cache, mtimes
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error loading slide {slide_data.get('slide_id')}: {e}"
+                )
+                continue
+            source_slides[id(slide_data)] = source_slide
+            dim = (source_prs.slide_width, source_prs.slide_height)
+            dimensions_count[dim] += 1
         
         # Use the most common dimensions, or default to 16:9 widescreen
         if dimensions_count:
-            target_dimensions = max(dimensions_count.items(), key=lambda x: x[1])[0]
+            target_dimensions = dimensions_count.most_common(1)[0][0]
         else:
             # Default to 16:9 widescreen (10 inches x 5.625 inches)
             target_dimensions = (9144000, 5143500)
@@ -83,8 +213,11 @@ class SlideAssembler:
         new_prs.slide_width = target_dimensions[0]
         new_prs.slide_height = target_dimensions[1]
         
-        # Counter for unique image naming (no deduplication)
+        # Counter for unique part naming, and copied parts keyed by content so
+        # a logo or background repeated across slides is stored only once
         image_counter = {'count': 0}
+        part_cache = {}
+        blank_layout = new_prs.slide_layouts[6]
         
         # Process slides in the requested order
         if preserve_order:
@@ -97,25 +230,16 @@ class SlideAssembler:
             )
         
         for slide_data in ordered_slides:
-            slide_file_path = slide_data.get('slide_file_path')
+            source_slide = source_slides.get(id(slide_data))
+            if source_slide is None:
+                # Failed to load (already logged)
+                continue
             
             try:
-                # If individual slide file exists, use it (new method)
-                if slide_file_path and Path(slide_file_path).exists():
-                    # Load the individual slide file (contains just one slide)
-                    source_prs = Presentation(slide_file_path)
-                    source_slide = source_prs.slides[0]  # Always first slide
-                    logger.debug(f"Loaded individual slide file: {slide_file_path}")
-                else:
-                    # Fallback to old method: load from original deck
-                    deck_path = slide_data['deck_path']
-                    slide_index = slide_data['slide_index']
-                    source_prs = Presentation(deck_path)
-                    source_slide = source_prs.slides[slide_index]
-                    logger.debug(f"Loaded slide from original deck: {deck_path} (index {slide_index})")
-                
                 # Copy slide to new presentation with unique image naming
-                SlideAssembler._copy_slide(source_slide, new_prs, image_counter)
+                SlideAssembler._copy_slide(
+                    source_slide, new_prs, image_counter, part_cache, blank_layout
+                )
                 
                 logger.debug(
                     f"Copied slide: {slide_data.get('title_header') or 'Untitled'}"
@@ -137,15 +261,191 @@ class SlideAssembler:
         output_path = settings.exports_dir / output_filename
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save new presentation
-        new_prs.save(str(output_path))
+        # Save to a temporary file and swap it into place atomically, so a
+        # concurrent download never sees a partially written presentation
+        fd, tmp_path = tempfile.mkstemp(
+            dir=output_path.parent, prefix=".", suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            # Same as new_prs.save(), but media is not deflated a second time
+            package = new_prs.part.package
+            _PackageWriter.write(tmp_path, package._rels, tuple(package.iter_parts()))
+            os.chmod(tmp_path, _EXPORT_FILE_MODE)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        
+        # Drop this assembly's references (recently used sources stay in
+        # the _parse_presentation cache)
+        source_slides.clear()
+        prs_cache.clear()
         
         logger.info(f"Presentation assembled: {output_path} ({len(new_prs.slides)} slides)")
         
         return output_path
     
     @staticmethod
-    def _copy_slide(source_slide, target_presentation: Presentation, image_counter: dict = None) -> None:
+    def _mtime_ns(path: str, mtimes: dict) -> Optional[int]:
+        """Modification time of path (None if missing), stat()ed once per assembly."""
+        if path not in mtimes:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = None
+        return mtimes[path]
+    
+    @staticmethod
+    def _source_path(slide_data: dict, mtimes: dict) -> str:
+        """Path of the file a slide row is copied from."""
+        slide_file_path = slide_data.get('slide_file_path')
+        if slide_file_path and SlideAssembler._mtime_ns(slide_file_path, mtimes) is not None:
+            return slide_file_path
+        return slide_data['deck_path']
+    
+    @staticmethod
+    def _prefetch_presentations(slides_data: List[dict], mtimes: dict) -> dict:
+        """
+        Parse every distinct source file up front, several at a time.
+        
+        Unzipping and XML parsing run in C with the GIL released, so
+        threads overlap the bulk of the work. Files that fail to parse are
+        left out; the per-slide load then reports them.
+        
+        Args:
+            slides_data: Slide rows (with deck info)
+            mtimes: Per-assembly stat results, filled in for every source
+        
+        Returns:
+            Presentations keyed by path, for use as prs_cache
+        """
+        paths = list(dict.fromkeys(
+            SlideAssembler._source_path(slide_data, mtimes) for slide_data in slides_data
+        ))
+        workers = min(len(paths), max(1, settings.assembly_workers))
+        if workers <= 1:
+            return {}
+        
+        def parse(path):
+            try:
+                return SlideAssembler._get_prs(path, {}, mtimes)
+            except Exception:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assemble") as executor:
+            parsed = executor.map(parse, paths)
+            return {path: prs for path, prs in zip(paths, parsed) if prs is not None}
+    
+    @staticmethod
+    def _load_source_slide(slide_data: dict, prs_cache: dict, mtimes: dict):
+        """
+        Load the source presentation and slide for a slide row.
+        
+        Args:
+            slide_data: Slide row (with deck info)
+            prs_cache: Presentations already parsed during this assembly, keyed
+                       by path; repeated slide files and several slides from
+                       one original deck are parsed only once
+            mtimes: Per-assembly stat results (see _mtime_ns)
+        
+        Returns:
+            (presentation, slide) tuple
+        """
+        slide_file_path = slide_data.get('slide_file_path')
+        
+        # If individual slide file exists, use it (new method)
+        if slide_file_path and SlideAssembler._mtime_ns(slide_file_path, mtimes) is not None:
+            # Load the individual slide file (contains just one slide)
+            source_prs = SlideAssembler._get_prs(slide_file_path, prs_cache, mtimes)
+            logger.debug("Loaded individual slide file: {}", slide_file_path)
+            return source_prs, source_prs.slides[0]  # Always first slide
+        
+        # Fallback to old method: load from original deck
+        deck_path = slide_data['deck_path']
+        slide_index = slide_data['slide_index']
+        source_prs = SlideAssembler._get_prs(deck_path, prs_cache, mtimes)
+        logger.debug("Loaded slide from original deck: {} (index {})", deck_path, slide_index)
+        return source_prs, source_prs.slides[slide_index]
+    
+    @staticmethod
+    def _get_prs(path: str, prs_cache: dict, mtimes: dict) -> Presentation:
+        """Parse a presentation, or return it from prs_cache if already parsed."""
+        source_prs = prs_cache.get(path)
+        if source_prs is None:
+            mtime_ns = SlideAssembler._mtime_ns(path, mtimes)
+            if mtime_ns is None:
+                raise FileNotFoundError(f"Source presentation not found: {path}")
+            source_prs = prs_cache[path] = _parse_presentation(path, mtime_ns)
+        return source_prs
+    
+    @staticmethod
+    def _find_copied_part(part_cache: dict, content_type: str, blob: bytes) -> Optional[Part]:
+        """
+        Part already copied into the target with exactly this content, if any.
+        
+        Parts are bucketed by (content type, size), so content of a size not
+        seen before is never hashed or compared; within a bucket the bytes
+        are compared directly (identical objects, such as one source part
+        related from many slides, match without reading them).
+        """
+        for part in part_cache.get((content_type, len(blob)), ()):
+            if part.blob == blob:
+                return part
+        return None
+    
+    @staticmethod
+    def _copy_part(
+        related_part,
+        blob: bytes,
+        content_type: str,
+        partname_stem: str,
+        target_pkg,
+        image_counter: dict,
+        part_cache: Optional[dict],
+    ) -> Part:
+        """
+        Copy a non-image part into the target package, reusing an identical one.
+        
+        Args:
+            related_part: Source part to copy
+            blob: Content of the source part
+            content_type: Content type of the new part
+            partname_stem: Part name without number and extension
+                           (e.g. '/ppt/media/media')
+            target_pkg: Package of the target presentation
+            image_counter: Dict with 'count' key for unique part naming
+            part_cache: Parts already copied, bucketed by (content type, size),
+                        or None to always create a separate part
+        
+        Returns:
+            The new (or previously copied identical) part
+        """
+        if part_cache is not None:
+            new_part = SlideAssembler._find_copied_part(part_cache, content_type, blob)
+            if new_part is not None:
+                return new_part
+        
+        # Generate unique part name, keeping the original extension
+        image_counter['count'] += 1
+        partname = getattr(related_part, 'partname', None)
+        ext = (partname.ext if partname is not None else '') or 'bin'
+        unique_partname = f'{partname_stem}{image_counter["count"]}.{ext}'
+        
+        # Saved with the package once the slide relates to it
+        new_part = _LazyPart(unique_partname, content_type, target_pkg, related_part)
+        if part_cache is not None:
+            part_cache.setdefault((content_type, len(blob)), []).append(new_part)
+        return new_part
+    
+    @staticmethod
+    def _copy_slide(
+        source_slide,
+        target_presentation: Presentation,
+        image_counter: dict = None,
+        part_cache: dict = None,
+        blank_layout=None,
+    ) -> None:
         """
         Copy a slide from source to target presentation using deep XML cloning.
         This preserves all formatting, shapes, images, and content.
@@ -154,14 +454,21 @@ class SlideAssembler:
             source_slide: Source slide to copy
             target_presentation: Target presentation
             image_counter: Optional dict with 'count' key for unique image naming
+            part_cache: Optional dict of parts already copied into the target,
+                        bucketed by (content type, size in bytes)
+            blank_layout: Optional blank layout of the target, looked up once
+                          per assembly (defaults to slide_layouts[6])
         
         Note: Target presentation dimensions should already be set before calling this.
         """
         if image_counter is None:
             image_counter = {'count': 0}
+        if part_cache is None:
+            part_cache = {}
         
         # Get a blank slide layout from target
-        blank_layout = target_presentation.slide_layouts[6]
+        if blank_layout is None:
+            blank_layout = target_presentation.slide_layouts[6]
 
         # Add new slide with blank layout
         new_slide = target_presentation.slides.add_slide(blank_layout)
@@ -169,135 +476,99 @@ class SlideAssembler:
         # Deep copy the entire slide XML tree from source to target
         # Collect newly inserted elements so we can remap relationship ids
         new_elements = []
-        for shape in source_slide.shapes:
+        # Shapes go before the optional trailing p:extLst; look it up once
+        # instead of rescanning spTree's children for every inserted shape
+        spTree = new_slide.shapes._spTree
+        extLst = spTree.find(_P_EXTLST)
+        insert = extLst.addprevious if extLst is not None else spTree.append
+        # Walk the shape elements directly rather than building a shape proxy
+        # for each one; copy() on an lxml element clones the whole subtree in
+        # C without deepcopy's memo bookkeeping
+        for el in source_slide.shapes._spTree.iter_shape_elms():
             try:
-                el = shape.element
-                newel = deepcopy(el)
-                new_slide.shapes._spTree.insert_element_before(newel, 'p:extLst')
+                newel = copy(el)
+                insert(newel)
                 new_elements.append(newel)
             except Exception as e:
-                logger.debug(f"Could not copy shape {getattr(shape, 'name', '')}: {e}")
+                logger.debug(f"Could not copy shape {getattr(el, 'name', '')}: {e}")
 
         # Copy all relationships including images, media, and embedded objects (OLE, charts, etc.)
         # Map old rIds -> new rIds so we can remap r:embed and r:id attributes in the copied XML
         old_to_new = {}
+        slide_part = new_slide.part
+        target_pkg = target_presentation.part.package
         try:
-            for rId, rel in list(source_slide.part.rels.items()):
+            for rId, rel in source_slide.part.rels.items():
                 try:
+                    kind = _reltype_kind(rel.reltype)
+                    if kind == 'skip':
+                        logger.debug("Skipping internal relationship: {}", rel.reltype)
+                        continue
+                    
+                    # Hyperlinks and linked media point outside the package;
+                    # only the target URL is carried over
+                    if rel.is_external:
+                        old_to_new[rId] = slide_part.relate_to(
+                            rel.target_ref, rel.reltype, is_external=True
+                        )
+                        continue
+                    
+                    # Read the source part once; every branch works from these
                     related_part = rel.target_part
+                    blob = getattr(related_part, 'blob', None)
+                    content_type = getattr(related_part, 'content_type', None)
                     new_part = None
                     
-                    # Handle different relationship types
-                    reltype_lower = rel.reltype.lower()
-                    
-                    # Skip internal PPTX structure relationships (layouts, masters, themes)
-                    # These should not be copied - they belong to the presentation template
-                    skip_reltypes = ['slidelayout', 'slidemaster', 'theme', 'notesmaster', 'notesslide', 'handoutmaster']
-                    if any(skip in reltype_lower for skip in skip_reltypes):
-                        logger.debug(f"Skipping internal relationship: {rel.reltype}")
-                        continue
+                    if blob is None:
+                        # Nothing to copy; relate to the original part below
+                        pass
                     
-                    if 'image' in reltype_lower:
+                    elif kind == 'image':
                         # Handle images
-                        try:
-                            blob = getattr(related_part, 'blob', None)
-                            content_type = getattr(related_part, 'content_type', None)
-                            target_pkg = target_presentation.part.package
-
-                            if blob is not None and content_type:
-                                try:
+                        if content_type:
+                            try:
+                                new_part = SlideAssembler._find_copied_part(
+                                    part_cache, content_type, blob
+                                )
+                                if new_part is None:
                                     image_counter['count'] += 1
                                     image = Image.from_blob(blob)
                                     new_part = ImagePart.new(target_pkg, image)
-                                except Exception as e:
-                                    logger.debug(f"Could not create image part: {e}")
-                                    new_part = None
-                        except Exception as e:
-                            logger.debug(f"Could not duplicate image: {e}")
-                    
-                    elif 'oleobject' in reltype_lower or 'package' in reltype_lower or 'embeddings' in reltype_lower:
-                        # Handle OLE objects, embedded packages, and smart objects
-                        # These need special handling - copy the blob as-is
-                        try:
-                            blob = getattr(related_part, 'blob', None)
-                            if blob is not None:
-                                # Create a new part in the target package with the same content type
-                                content_type = getattr(related_part, 'content_type', 'application/vnd.openxmlformats-officedocument.oleObject')
-                                
-                                # Generate unique part name
-                                image_counter['count'] += 1
-                                ext = 'bin'  # default extension
-                                if hasattr(related_part, 'partname'):
-                                    original_ext = str(related_part.partname).split('.')[-1]
-                                    if original_ext:
-                                        ext = original_ext
-                                
-                                unique_partname = f'/ppt/embeddings/oleObject{image_counter["count"]}.{ext}'
-                                
-                                # Add part directly to package
-                                new_part = Part(unique_partname, content_type, blob, target_presentation.part.package)
-                                target_presentation.part.package._parts[unique_partname] = new_part
-                                
-                                logger.debug(f"Copied OLE/embedded object: {unique_partname}")
-                        except Exception as e:
-                            logger.debug(f"Could not copy OLE object: {e}")
-                    
-                    elif 'media' in reltype_lower or 'video' in reltype_lower or 'audio' in reltype_lower:
-                        # Handle media files (video, audio)
-                        try:
-                            blob = getattr(related_part, 'blob', None)
-                            if blob is not None:
-                                content_type = getattr(related_part, 'content_type', 'application/octet-stream')
-                                image_counter['count'] += 1
-                                
-                                # Determine extension
-                                ext = 'bin'
-                                if hasattr(related_part, 'partname'):
-                                    original_ext = str(related_part.partname).split('.')[-1]
-                                    if original_ext:
-                                        ext = original_ext
-                                
-                                unique_partname = f'/ppt/media/media{image_counter["count"]}.{ext}'
-                                
-                                new_part = Part(unique_partname, content_type, blob, target_presentation.part.package)
-                                target_presentation.part.package._parts[unique_partname] = new_part
-                                
-                                logger.debug(f"Copied media: {unique_partname}")
-                        except Exception as e:
-                            logger.debug(f"Could not copy media: {e}")
+                                    part_cache.setdefault(
+                                        (content_type, len(blob)), []
+                                    ).append(new_part)
+                            except Exception as e:
+                                logger.debug(f"Could not create image part: {e}")
+                                new_part = None
                     
                     else:
-                        # For other relationship types (charts, hyperlinks, etc.), try generic copy
+                        # OLE objects and embedded packages, media (video, audio),
+                        # and other types (charts, etc.): copy the blob as-is
+                        default_content_type, partname_stem = _COPIED_PART_TYPES[kind]
                         try:
-                            blob = getattr(related_part, 'blob', None)
-                            if blob is not None:
-                                content_type = getattr(related_part, 'content_type', 'application/octet-stream')
-                                image_counter['count'] += 1
-                                
-                                ext = 'bin'
-                                if hasattr(related_part, 'partname'):
-                                    original_ext = str(related_part.partname).split('.')[-1]
-                                    if original_ext:
-                                        ext = original_ext
-                                
-                                unique_partname = f'/ppt/other/object{image_counter["count"]}.{ext}'
-                                
-                                new_part = Part(unique_partname, content_type, blob, target_presentation.part.package)
-                                target_presentation.part.package._parts[unique_partname] = new_part
-                                
-                                logger.debug(f"Copied other relationship type {rel.reltype}: {unique_partname}")
+                            new_part = SlideAssembler._copy_part(
+                                related_part,
+                                blob,
+                                content_type or default_content_type,
+                                partname_stem,
+                                target_pkg,
+                                image_counter,
+                                # Only media is shared; editing one copy of an
+                                # embedded object would change the others
+                                part_cache if kind == 'media' else None,
+                            )
+                            logger.debug("Copied {} part: {}", kind, new_part.partname)
                         except Exception as e:
-                            logger.debug(f"Could not copy relationship {rel.reltype}: {e}")
+                            logger.debug("Could not copy {} part {}: {}", kind, rel.reltype, e)
 
                     # Create relationship to the new part (or fallback to original)
                     try:
+                        # relate_to returns the new rId
                         if new_part is not None:
-                            new_rel = new_slide.part.relate_to(new_part, rel.reltype)
+                            old_to_new[rId] = slide_part.relate_to(new_part, rel.reltype)
                         else:
                             # Last-resort: relate to original part
-                            new_rel = new_slide.part.relate_to(related_part, rel.reltype)
-
-                        old_to_new[rId] = getattr(new_rel, 'rId', None)
+                            old_to_new[rId] = slide_part.relate_to(related_part, rel.reltype)
                     except Exception as e:
                         logger.debug(f"Could not create relationship on new slide: {e}")
                         
@@ -310,20 +581,18 @@ class SlideAssembler:
         if old_to_new:
             try:
                 for newel in new_elements:
-                    for node in newel.iter():
-                        # Remap r:embed attributes (e.g. in a:blip for images)
-                        embed_val = node.get(qn('r:embed'))
-                        if embed_val and embed_val in old_to_new:
-                            new_rid = old_to_new.get(embed_val)
-                            if new_rid:
-                                node.set(qn('r:embed'), new_rid)
-                        
-                        # Remap r:id attributes (e.g. in oleObject, media references)
-                        id_val = node.get(qn('r:id'))
-                        if id_val and id_val in old_to_new:
-                            new_rid = old_to_new.get(id_val)
-                            if new_rid:
-                                node.set(qn('r:id'), new_rid)
+                    for node in _REMAP_XPATH(newel):
+                        attrib = node.attrib
+                        # r:embed (e.g. in a:blip for images), r:id (e.g. in
+                        # oleObject, media references, hyperlinks) and r:link
+                        # (linked images); the new slide often allocates the
+                        # same rIds, so only changed values are written
+                        for attr in _REL_ATTRS:
+                            old_rid = attrib.get(attr)
+                            if old_rid:
+                                new_rid = old_to_new.get(old_rid)
+                                if new_rid and new_rid != old_rid:
+                                    attrib[attr] = new_rid
             except Exception as e:
                 logger.debug(f"Error remapping relationship attributes: {e}")
     
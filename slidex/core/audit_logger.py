@@ -4,9 +4,10 @@ Tracks all messages sent to and received from LLMs for full auditability.
 """
 
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
 
 from slidex.config import settings
@@ -19,13 +20,30 @@ class AuditLogger:
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize audit logger with database path."""
         self.db_path = db_path or settings.audit_db_path
+        self._local = threading.local()
         self._init_database()
     
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, opening it on first use.
+        
+        Connections stay open for the life of the thread. WAL with
+        synchronous=NORMAL makes each commit an append to the log instead
+        of an fsync of the database, and lets readers run alongside writers.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
     def _init_database(self) -> None:
         """Initialize the audit database schema."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         # Create audit log table
@@ -57,7 +75,6 @@ class AuditLogger:
         """)
         
         conn.commit()
-        conn.close()
         
         logger.debug(f"Audit database initialized at {self.db_path}")
     
@@ -88,32 +105,33 @@ class AuditLogger:
         Returns:
             ID of the inserted audit log entry
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         timestamp = datetime.utcnow().isoformat()
         metadata_json = json.dumps(metadata) if metadata else None
         
-        cursor.execute("""
-            INSERT INTO llm_audit_log 
-            (timestamp, session_id, model_name, operation_type, input_text, 
-             output_text, metadata, error, duration_ms)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            timestamp,
-            session_id,
-            model_name,
-            operation_type,
-            input_text,
-            output_text,
-            metadata_json,
-            error,
-            duration_ms,
-        ))
+        # Commits on success and rolls back on error, so a failed insert
+        # does not leave a transaction open on this thread's connection
+        with conn:
+            cursor.execute("""
+                INSERT INTO llm_audit_log 
+                (timestamp, session_id, model_name, operation_type, input_text, 
+                 output_text, metadata, error, duration_ms)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                timestamp,
+                session_id,
+                model_name,
+                operation_type,
+                input_text,
+                output_text,
+                metadata_json,
+                error,
+                duration_ms,
+            ))
         
         log_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
         
         logger.debug(
             f"Audit log entry created: id={log_id}, model={model_name}, "
@@ -122,11 +140,51 @@ class AuditLogger:
         
         return log_id
     
+    def log_llm_calls_batch(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Log several LLM interactions in a single transaction.
+        
+        Args:
+            entries: Dicts with the same keys as log_llm_call arguments
+            
+        Returns:
+            Number of audit log entries inserted
+        """
+        if not entries:
+            return 0
+        
+        timestamp = datetime.utcnow().isoformat()
+        rows = [
+            (
+                timestamp,
+                entry.get("session_id"),
+                entry["model_name"],
+                entry["operation_type"],
+                entry.get("input_text"),
+                entry.get("output_text"),
+                json.dumps(entry["metadata"]) if entry.get("metadata") else None,
+                entry.get("error"),
+                entry.get("duration_ms"),
+            )
+            for entry in entries
+        ]
+        
+        with self._get_conn() as conn:
+            conn.executemany("""
+                INSERT INTO llm_audit_log 
+                (timestamp, session_id, model_name, operation_type, input_text, 
+                 output_text, metadata, error, duration_ms)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        
+        logger.debug(f"Audit log entries created in batch: {len(rows)}")
+        
+        return len(rows)
+    
     def get_recent_logs(self, limit: int = 100) -> list:
         """Retrieve recent audit log entries."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._get_conn().cursor()
+        cursor.row_factory = sqlite3.Row
         
         cursor.execute("""
             SELECT * FROM llm_audit_log 
@@ -135,15 +193,13 @@ class AuditLogger:
         """, (limit,))
         
         rows = cursor.fetchall()
-        conn.close()
         
         return [dict(row) for row in rows]
     
     def get_session_logs(self, session_id: str) -> list:
         """Retrieve all logs for a specific session."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._get_conn().cursor()
+        cursor.row_factory = sqlite3.Row
         
         cursor.execute("""
             SELECT * FROM llm_audit_log 
@@ -152,7 +208,6 @@ class AuditLogger:
         """, (session_id,))
         
         rows = cursor.fetchall()
-        conn.close()
         
         return [dict(row) for row in rows]
 
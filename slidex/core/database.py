@@ -4,7 +4,10 @@ Database helper functions for PostgreSQL operations.
 
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from typing import Optional, Dict, Any, List
+import io
+import threading
 import uuid
 from datetime import datetime
 from contextlib import contextmanager
@@ -13,19 +16,73 @@ from slidex.config import settings
 from slidex.logging_config import logger
 
 
+def _copy_text_value(value: Any) -> str:
+    """Format a value for PostgreSQL's COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    minconn=settings.database_pool_min_connections,
+                    maxconn=settings.database_pool_max_connections,
+                    dsn=settings.database_url,
+                )
+                logger.debug(
+                    f"Database connection pool created "
+                    f"(max={settings.database_pool_max_connections})"
+                )
+    return _pool
+
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections."""
-    conn = psycopg2.connect(settings.database_url)
+    """
+    Context manager for database connections.
+    
+    Connections are checked out of a shared pool so repeated operations don't
+    pay the connect/auth handshake each time. If the pool is exhausted, a
+    dedicated connection is opened and closed instead.
+    """
+    pool = _get_pool()
+    try:
+        conn = pool.getconn()
+        pooled = True
+    except PoolError:
+        conn = psycopg2.connect(settings.database_url)
+        pooled = False
+    
     try:
         yield conn
         conn.commit()
     except Exception as e:
-        conn.rollback()
+        if not conn.closed:
+            conn.rollback()
         logger.error(f"Database error: {e}")
         raise
     finally:
-        conn.close()
+        if pooled:
+            pool.putconn(conn, close=bool(conn.closed))
+        else:
+            conn.close()
 
 
 class Database:
@@ -178,6 +235,60 @@ class Database:
             result = cur.fetchone()
             logger.debug(f"Slide inserted: {slide_id} (deck: {deck_id}, index: {slide_index})")
     
+    @staticmethod
+    def insert_slides_batch(slides: List[Dict[str, Any]]) -> int:
+        """
+        Insert many slides with pre-generated slide_ids in one round-trip.
+        
+        Rows are streamed with COPY FROM STDIN, PostgreSQL's fastest bulk
+        load path, instead of opening a connection and issuing one INSERT
+        per slide.
+        
+        Args:
+            slides: Dicts with the same keys as insert_slide_with_id arguments
+            
+        Returns:
+            Number of slides inserted
+        """
+        if not slides:
+            return 0
+        
+        buffer = io.StringIO()
+        for s in slides:
+            row = (
+                s["slide_id"],
+                s["deck_id"],
+                s["slide_index"],
+                s.get("title_header"),
+                s["plain_text"],
+                s["summary"],
+                s["thumbnail_path"],
+                s["original_slide_position"],
+                s.get("slide_file_path"),
+                s.get("slide_pdf_path"),
+                s.get("requires_pdf", False),
+                s.get("complexity_score", 0),
+            )
+            buffer.write("\t".join(_copy_text_value(v) for v in row))
+            buffer.write("\n")
+        buffer.seek(0)
+        
+        with get_db_connection() as conn:
+            cur = conn.cursor()
+            cur.copy_expert(
+                """
+                COPY slides 
+                (slide_id, deck_id, slide_index, title_header, plain_text, 
+                 summary_10_20_words, thumbnail_path, original_slide_position, 
+                 slide_file_path, slide_pdf_path, requires_pdf, complexity_score)
+                FROM STDIN
+                """,
+                buffer,
+            )
+        
+        logger.debug(f"Slides inserted in batch: {len(slides)}")
+        return len(slides)
+    
     @staticmethod
     def get_slide_by_id(slide_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve slide by ID."""
@@ -196,6 +307,39 @@ class Database:
             return dict(result) if result else None
             return [dict(row) for row in results]
     
+    @staticmethod
+    def get_slides_by_ids(slide_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieve several slides (with deck info) in one query.
+        
+        The ids are sent as a single array parameter, so there is no
+        placeholder limit to chunk around. Results follow the order of
+        slide_ids; unknown or malformed ids are skipped.
+        """
+        wanted = []
+        for slide_id in slide_ids:
+            try:
+                wanted.append(str(uuid.UUID(str(slide_id))))
+            except ValueError:
+                continue
+        if not wanted:
+            return []
+        
+        with get_db_connection() as conn:
+            cur = conn.cursor(cursor_factory=RealDictCursor)
+            cur.execute(
+                """
+                SELECT s.*, d.filename as deck_filename, d.original_path as deck_path
+                FROM slides s
+                JOIN decks d ON s.deck_id = d.deck_id
+                WHERE s.slide_id = ANY(%s::uuid[])
+                """,
+                (list(set(wanted)),)
+            )
+            by_id = {str(row["slide_id"]): dict(row) for row in cur.fetchall()}
+        
+        return [by_id[slide_id] for slide_id in wanted if slide_id in by_id]
+    
     @staticmethod
     def get_all_decks() -> List[Dict[str, Any]]:
         """Retrieve all decks."""
@@ -2,26 +2,72 @@
 FastAPI dependencies for authentication.
 """
 
+import asyncio
+import hashlib
 from typing import Optional, Dict, Any
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.security import APIKeyCookie
 
+from slidex.config import settings
 from slidex.core.auth_service import auth_service
 from slidex.logging_config import logger
 
 # Cookie scheme to make Swagger UI happy (optional)
 cookie_scheme = APIKeyCookie(name="session_id", auto_error=False)
 
+# Configured API keys, indexed by SHA-256 digest so a lookup neither stores
+# nor compares raw keys
+_API_KEY_NAMES = {
+    hashlib.sha256(key.encode()).digest(): name
+    for name, key in settings.api_keys.items()
+    if key
+}
+
+
+def _verify_api_key(api_key: str) -> Optional[Dict[str, Any]]:
+    """Return the pseudo-user for a configured API key, or None."""
+    name = _API_KEY_NAMES.get(hashlib.sha256(api_key.encode()).digest())
+    if name is None:
+        return None
+    return {
+        "user_id": f"api-key:{name}",
+        "email": None,
+        "name": name,
+        "picture": None,
+        "session_id": None
+    }
+
+
 async def get_current_user_optional(request: Request) -> Optional[Dict[str, Any]]:
     """
     Get current authenticated user from session cookie.
     Returns None if not authenticated.
+    
+    The result is cached on request.state, so the auth middleware and the
+    route dependency share a single session lookup per request.
     """
+    if hasattr(request.state, "user"):
+        return request.state.user
+    
+    user = await _resolve_user(request)
+    request.state.user = user
+    return user
+
+
+async def _resolve_user(request: Request) -> Optional[Dict[str, Any]]:
+    """Look up the user for the request's API key or session cookie."""
+    # Server-to-server callers authenticate with a bearer API key, which is
+    # checked in memory without touching the session store
+    authorization = request.headers.get("authorization")
+    if _API_KEY_NAMES and authorization and authorization[:7].lower() == "bearer ":
+        return _verify_api_key(authorization[7:].strip())
+    
     session_id = request.cookies.get("session_id")
     if not session_id:
         return None
         
-    session = auth_service.get_session(session_id)
+    # Session lookup is a blocking database query; keep it off the event loop
+    session = await asyncio.to_thread(auth_service.get_session, session_id)
     if not session:
         return None
         
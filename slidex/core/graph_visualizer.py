@@ -13,6 +13,21 @@ from slidex.logging_config import logger
 class GraphVisualizer:
     """Visualize LightRAG knowledge graph."""
     
+    @staticmethod
+    def graph_version() -> str:
+        """
+        Cheap version tag for the graph file (mtime and size), without parsing it.
+        
+        Returns:
+            Version string, or "none" if the graph file doesn't exist yet
+        """
+        graph_file = settings.lightrag_working_dir / "graph_chunk_entity_relation.graphml"
+        try:
+            stat_result = graph_file.stat()
+        except FileNotFoundError:
+            return "none"
+        return f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"
+    
     @staticmethod
     def export_graph_data() -> Dict[str, Any]:
         """
@@ -26,15 +41,16 @@ class GraphVisualizer:
             working_dir = settings.lightrag_working_dir
             graph_file = working_dir / "graph_chunk_entity_relation.graphml"
             
-            if not graph_file.exists():
-                logger.warning("LightRAG graph file not found. Run ingestion first.")
-                return {"nodes": [], "edges": []}
-            
             # Load and parse the graph
             import networkx as nx
             
-            # LightRAG stores graph as GraphML
-            G = nx.read_graphml(str(graph_file))
+            # LightRAG stores graph as GraphML; opening it doubles as the
+            # existence check (no separate stat)
+            try:
+                G = nx.read_graphml(str(graph_file))
+            except FileNotFoundError:
+                logger.warning("LightRAG graph file not found. Run ingestion first.")
+                return {"nodes": [], "edges": []}
             
             # Convert to Cytoscape.js format
             nodes = []
@@ -91,11 +107,11 @@ class GraphVisualizer:
             working_dir = settings.lightrag_working_dir
             graph_file = working_dir / "graph_chunk_entity_relation.graphml"
             
-            if not graph_file.exists():
-                return {"error": "Graph not found"}
-            
             import networkx as nx
-            G = nx.read_graphml(str(graph_file))
+            try:
+                G = nx.read_graphml(str(graph_file))
+            except FileNotFoundError:
+                return {"error": "Graph not found"}
             
             stats = {
                 "nodes": G.number_of_nodes(),
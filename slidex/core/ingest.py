@@ -4,7 +4,9 @@ Handles file discovery, deduplication, text extraction, embedding generation, an
 """
 
 import hashlib
+import itertools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 from pptx import Presentation
@@ -18,30 +20,72 @@ from slidex.core.lightrag_client import lightrag_client
 from slidex.core.pdf_processor import pdf_processor
 
 
+# Source of IngestEngine.data_version values; next() on a count is atomic,
+# so concurrent ingests never hand out the same version
+_data_versions = itertools.count(1)
+
+
 class IngestEngine:
     """Engine for ingesting PowerPoint presentations."""
     
+    # Bumped after every successful ingest so read caches can invalidate
+    data_version = 0
+    
     @staticmethod
-    def compute_file_hash(file_path: Path) -> str:
-        """Compute SHA256 hash of a file."""
-        sha256_hash = hashlib.sha256()
+    def compute_file_hash(file_path: Path, content_sha256: Optional[str] = None) -> str:
+        """
+        Compute SHA256 hash of a file.
         
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+        Args:
+            file_path: Path to the file
+            content_sha256: Hex SHA-256 of the file contents, if already known
+                (e.g. computed while an upload was written); skips re-reading
+        """
+        if content_sha256 is None:
+            sha256_hash = hashlib.sha256()
+            
+            with open(file_path, "rb") as f:
+                # Read in chunks to handle large files
+                for byte_block in iter(lambda: f.read(1 << 20), b""):
+                    sha256_hash.update(byte_block)
+            content_sha256 = sha256_hash.hexdigest()
         
         # Include file size and mtime for extra uniqueness
         stat = file_path.stat()
-        hash_input = f"{sha256_hash.hexdigest()}_{stat.st_size}_{stat.st_mtime}"
+        hash_input = f"{content_sha256}_{stat.st_size}_{stat.st_mtime}"
         
         return hashlib.sha256(hash_input.encode()).hexdigest()
     
+    @staticmethod
+    def _summarize_slide(
+        slide_idx: int,
+        plain_text: str,
+        visual_context: str,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """Generate the summary for one slide, falling back to its text on error."""
+        try:
+            # For very minimal text (< 15 chars), create simple summary without LLM
+            if len(plain_text.strip()) < 15:
+                if visual_context:
+                    return f"{plain_text.strip()} - {visual_context}"
+                return f"Slide: {plain_text.strip()}"
+            return ollama_client.generate_summary(
+                plain_text,
+                max_words=20,
+                session_id=session_id,
+                visual_context=visual_context if visual_context else None
+            )
+        except Exception as e:
+            logger.error(f"Error generating summary for slide {slide_idx}: {e}")
+            return plain_text[:100]  # Fallback to truncated text
+    
     @staticmethod
     def ingest_file(
         file_path: Path,
         uploader: Optional[str] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        precomputed_sha256: Optional[str] = None
     ) -> Optional[str]:
         """
         Ingest a single PowerPoint file.
@@ -50,6 +94,8 @@ class IngestEngine:
             file_path: Path to the .pptx file
             uploader: Optional uploader name
             session_id: Optional session ID for audit logging
+            precomputed_sha256: Optional hex SHA-256 of the file contents,
+                used instead of reading the file again to hash it
             
         Returns:
             deck_id if successful, None if skipped (duplicate)
@@ -67,7 +113,7 @@ class IngestEngine:
         logger.info(f"Starting ingestion: {file_path}")
         
         # Compute file hash
-        file_hash = IngestEngine.compute_file_hash(file_path)
+        file_hash = IngestEngine.compute_file_hash(file_path, precomputed_sha256)
         logger.debug(f"File hash: {file_hash}")
         
         # Check if already ingested
@@ -110,122 +156,135 @@ class IngestEngine:
 
         # Collect slide metadata for PDF extraction and DB insert
         slide_data_for_pdf = []
+
+        summary_futures = []
         
-        # Process each slide
-        for slide_idx, slide in enumerate(presentation.slides):
-            logger.debug(f"Processing slide {slide_idx + 1}/{slide_count}")
-            
-            # Extract text
-            title_header, plain_text = slide_processor.extract_text_from_slide(slide)
-            
-            # Extract visual content information
-            visual_context = slide_processor.extract_visual_content_info(slide)
-            
-            if not plain_text.strip():
-                logger.warning(f"Slide {slide_idx} has no text, using placeholder")
-                plain_text = f"[Slide {slide_idx + 1}]"
-            
-            # Generate slide_id early so we can use it for file naming
-            slide_id = db.generate_slide_id()
-            
-            # Save individual slide as standalone .pptx file
-            slide_filename = f"{slide_id}.pptx"
-            slide_file_path = settings.slides_dir / slide_filename
-            slide_processor.save_slide_as_file(
-                presentation,
-                slide_idx,
-                slide_file_path
-            )
-            
-            # Generate thumbnail
-            thumbnail_filename = f"{deck_id}_{slide_idx}.png"
-            thumbnail_path = settings.thumbnails_dir / deck_id / thumbnail_filename
-            slide_processor.generate_thumbnail(
-                presentation,
-                slide_idx,
-                thumbnail_path,
-                width=settings.thumbnail_width,
-                deck_pdf_path=deck_pdf_path,
-            )
-            
-            # Generate summary
+        # Stored file paths are made relative to the working directory
+        project_root = Path.cwd().resolve()
+        
+        # Summaries are I/O-bound Ollama calls; bound how many run at once.
+        # Leaving the block shuts the pool down, also when a slide fails
+        with ThreadPoolExecutor(
+            max_workers=max(1, settings.ollama_max_concurrency)
+        ) as summary_executor:
             try:
-                # For very minimal text (< 15 chars), create simple summary without LLM
-                if len(plain_text.strip()) < 15:
-                    if visual_context:
-                        summary = f"{plain_text.strip()} - {visual_context}"
-                    else:
-                        summary = f"Slide: {plain_text.strip()}"
-                    logger.debug(f"Using simple summary for minimal text slide")
-                else:
-                    summary = ollama_client.generate_summary(
-                        plain_text,
-                        max_words=20,
-                        session_id=session_id,
-                        visual_context=visual_context if visual_context else None
+                # Process each slide
+                for slide_idx, slide in enumerate(presentation.slides):
+                    logger.debug("Processing slide {}/{}", slide_idx + 1, slide_count)
+                    
+                    # Extract text
+                    title_header, plain_text = slide_processor.extract_text_from_slide(slide)
+                    
+                    # Extract visual content information
+                    visual_context = slide_processor.extract_visual_content_info(slide)
+                    
+                    if not plain_text.strip():
+                        logger.warning(f"Slide {slide_idx} has no text, using placeholder")
+                        plain_text = f"[Slide {slide_idx + 1}]"
+                    
+                    # Generate slide_id early so we can use it for file naming
+                    slide_id = db.generate_slide_id()
+                    
+                    # Save individual slide as standalone .pptx file
+                    slide_filename = f"{slide_id}.pptx"
+                    slide_file_path = settings.slides_dir / slide_filename
+                    slide_processor.save_slide_as_file(
+                        presentation,
+                        slide_idx,
+                        slide_file_path
                     )
-            except Exception as e:
-                logger.error(f"Error generating summary for slide {slide_idx}: {e}")
-                summary = plain_text[:100]  # Fallback to truncated text
-            
-            # Complexity and PDF preference are no longer used for control flow.
-            # Keep default values for backward-compatible schema.
-            complexity_score = 0
-            requires_pdf = False
+                    
+                    # Generate thumbnail
+                    thumbnail_filename = f"{deck_id}_{slide_idx}.png"
+                    thumbnail_path = settings.thumbnails_dir / deck_id / thumbnail_filename
+                    slide_processor.generate_thumbnail(
+                        presentation,
+                        slide_idx,
+                        thumbnail_path,
+                        width=settings.thumbnail_width,
+                        deck_pdf_path=deck_pdf_path,
+                    )
+                    
+                    # Queue summary generation; it runs on the worker pool while
+                    # the remaining slides are saved and thumbnailed
+                    summary_futures.append(
+                        summary_executor.submit(
+                            IngestEngine._summarize_slide,
+                            slide_idx,
+                            plain_text,
+                            visual_context,
+                            session_id,
+                        )
+                    )
+                    
+                    # Complexity and PDF preference are no longer used for control flow.
+                    # Keep default values for backward-compatible schema.
+                    complexity_score = 0
+                    requires_pdf = False
 
-            # Prepare embedding input
-            embedding_input = f"{title_header or ''}\n{plain_text}\n{summary}"
-            
-            # Placeholder vector_id (not used with LightRAG)
-            vector_id = slide_idx
-            
-            # Store paths relative to project root, or absolute if outside
-            try:
-                # Try to make it relative to current working directory
-                rel_thumbnail_path = thumbnail_path.resolve().relative_to(Path.cwd().resolve())
-                thumbnail_path_str = str(rel_thumbnail_path)
-            except ValueError:
-                # If not in subpath, use absolute path
-                thumbnail_path_str = str(thumbnail_path.resolve())
-            
-            try:
-                rel_slide_file_path = slide_file_path.resolve().relative_to(Path.cwd().resolve())
-                slide_file_path_str = str(rel_slide_file_path)
-            except ValueError:
-                slide_file_path_str = str(slide_file_path.resolve())
-            
-            # Record slide data for later DB insert after optional PDF extraction
-            slide_data_for_pdf.append(
-                {
-                    "slide_id": slide_id,
-                    "deck_id": deck_id,
-                    "slide_index": slide_idx,
-                    "title_header": title_header,
-                    "plain_text": plain_text,
-                    "summary": summary,
-                    "thumbnail_path": thumbnail_path_str,
-                    "original_slide_position": slide_idx,
-                    "slide_file_path": slide_file_path_str,
-                    "complexity_score": complexity_score,
-                    "requires_pdf": requires_pdf,
-                    "vector_id": vector_id,
-                }
-            )
-            
-            # Collect data for LightRAG batch insert
-            if settings.lightrag_enabled:
+                    # Placeholder vector_id (not used with LightRAG)
+                    vector_id = slide_idx
+                    
+                    # Store paths relative to project root, or absolute if outside.
+                    # The storage dirs are already resolved (Settings.resolve_storage_root),
+                    # so this is purely lexical, without per-slide resolve() syscalls
+                    try:
+                        # Try to make it relative to current working directory
+                        rel_thumbnail_path = thumbnail_path.relative_to(project_root)
+                        thumbnail_path_str = str(rel_thumbnail_path)
+                    except ValueError:
+                        # If not in subpath, use absolute path
+                        thumbnail_path_str = str(thumbnail_path)
+                    
+                    try:
+                        rel_slide_file_path = slide_file_path.relative_to(project_root)
+                        slide_file_path_str = str(rel_slide_file_path)
+                    except ValueError:
+                        slide_file_path_str = str(slide_file_path)
+                    
+                    # Record slide data for later DB insert after optional PDF extraction
+                    slide_data_for_pdf.append(
+                        {
+                            "slide_id": slide_id,
+                            "deck_id": deck_id,
+                            "slide_index": slide_idx,
+                            "title_header": title_header,
+                            "plain_text": plain_text,
+                            "summary": None,  # Filled in once the summary future resolves
+                            "thumbnail_path": thumbnail_path_str,
+                            "original_slide_position": slide_idx,
+                            "slide_file_path": slide_file_path_str,
+                            "complexity_score": complexity_score,
+                            "requires_pdf": requires_pdf,
+                            "vector_id": vector_id,
+                        }
+                    )
+                
+                # Collect summaries in slide order
+                for data, future in zip(slide_data_for_pdf, summary_futures):
+                    data["summary"] = future.result()
+            except BaseException:
+                # Don't leave queued Ollama calls running after a failed slide
+                for future in summary_futures:
+                    future.cancel()
+                raise
+        
+        # Collect data for LightRAG batch insert
+        if settings.lightrag_enabled:
+            for data in slide_data_for_pdf:
+                embedding_input = (
+                    f"{data['title_header'] or ''}\n{data['plain_text']}\n{data['summary']}"
+                )
                 lightrag_documents.append({
                     'text': embedding_input,
-                    'id': slide_id,
+                    'id': data['slide_id'],
                     'metadata': {
                         'deck_id': deck_id,
                         'deck_filename': file_path.name,
-                        'slide_index': slide_idx,
-                        'title': title_header or f"Slide {slide_idx + 1}",
+                        'slide_index': data['slide_index'],
+                        'title': data['title_header'] or f"Slide {data['slide_index'] + 1}",
                     }
                 })
-            
-            logger.debug(f"Slide {slide_idx + 1} processed successfully")
         
         # Convert entire deck to PDF and extract per-slide PDFs
         pdf_path = deck_pdf_path
@@ -246,21 +305,7 @@ class IngestEngine:
                 logger.error(f"PDF conversion failed: {e}")
 
         # Insert slide rows now that we have optional PDF paths
-        for data in slide_data_for_pdf:
-            db.insert_slide_with_id(
-                slide_id=data["slide_id"],
-                deck_id=data["deck_id"],
-                slide_index=data["slide_index"],
-                title_header=data["title_header"],
-                plain_text=data["plain_text"],
-                summary=data["summary"],
-                thumbnail_path=data["thumbnail_path"],
-                original_slide_position=data["original_slide_position"],
-                slide_file_path=data["slide_file_path"],
-                slide_pdf_path=data.get("slide_pdf_path"),
-                requires_pdf=data["requires_pdf"],
-                complexity_score=data["complexity_score"],
-            )
+        db.insert_slides_batch(slide_data_for_pdf)
 
         # Insert all slides into LightRAG in batch
         if settings.lightrag_enabled and lightrag_documents:
@@ -272,27 +317,22 @@ class IngestEngine:
                 logger.error(f"Error inserting documents into LightRAG: {e}")
                 # Continue anyway as metadata is in PostgreSQL
         
-        logger.info(f"Ingestion complete: {file_path} (deck_id: {deck_id})")
+        IngestEngine.data_version = next(_data_versions)
+        
+        logger.info(f"Ingestion complete: {file_path} (deck_id: {deck_id}, slides: {slide_count})")
         return deck_id
     
     @staticmethod
-    def ingest_folder(
-        folder_path: Path,
-        recursive: bool = True,
-        uploader: Optional[str] = None,
-        session_id: Optional[str] = None
-    ) -> List[str]:
+    def find_pptx_files(folder_path: Path, recursive: bool = True) -> List[Path]:
         """
-        Ingest all PowerPoint files in a folder.
+        Find the PowerPoint files in a folder, skipping Office lock files.
         
         Args:
             folder_path: Path to the folder
             recursive: Whether to search recursively
-            uploader: Optional uploader name
-            session_id: Optional session ID for audit logging
             
         Returns:
-            List of deck_ids for successfully ingested files
+            List of .pptx file paths
         """
         folder_path = Path(folder_path).resolve()
         
@@ -316,17 +356,43 @@ class IngestEngine:
         pptx_files = [f for f in pptx_files if not f.name.startswith("~$")]
         
         logger.info(f"Found {len(pptx_files)} .pptx files")
+        return pptx_files
+    
+    @staticmethod
+    def ingest_folder(
+        folder_path: Path,
+        recursive: bool = True,
+        uploader: Optional[str] = None,
+        session_id: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Ingest all PowerPoint files in a folder.
         
-        deck_ids = []
-        for pptx_file in pptx_files:
+        Args:
+            folder_path: Path to the folder
+            recursive: Whether to search recursively
+            uploader: Optional uploader name
+            session_id: Optional session ID for audit logging
+            max_workers: Number of files ingested concurrently
+                         (defaults to settings.ingest_concurrency)
+            
+        Returns:
+            List of deck_ids for successfully ingested files
+        """
+        pptx_files = IngestEngine.find_pptx_files(folder_path, recursive)
+        workers = max(1, max_workers or settings.ingest_concurrency)
+        
+        def ingest_one(pptx_file: Path) -> Optional[str]:
             try:
-                deck_id = IngestEngine.ingest_file(pptx_file, uploader, session_id)
-                if deck_id:
-                    deck_ids.append(deck_id)
+                return IngestEngine.ingest_file(pptx_file, uploader, session_id)
             except Exception as e:
                 logger.error(f"Error ingesting {pptx_file}: {e}")
                 # Continue with other files
-                continue
+                return None
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as executor:
+            deck_ids = [deck_id for deck_id in executor.map(ingest_one, pptx_files) if deck_id]
         
         logger.info(f"Folder ingestion complete: {len(deck_ids)} new decks ingested")
         return deck_ids
@@ -4,25 +4,22 @@ Integrates LightRAG with Ollama models and audit logging.
 """
 
 import asyncio
+import os
+import threading
 import time
 import traceback
+import weakref
 from typing import List, Optional, Dict, Any, Literal
 import numpy as np
+import ollama
 
 from lightrag import LightRAG, QueryParam
-from lightrag.llm.ollama import ollama_model_complete, ollama_embed
+from lightrag.api import __api_version__
+from lightrag.llm.ollama import ollama_model_complete
 from lightrag.utils import wrap_embedding_func_with_attrs
 from lightrag.kg.shared_storage import initialize_pipeline_status
 from lightrag.rerank import generic_rerank_api
 
-# Apply nest_asyncio to allow nested event loops (needed for Flask + asyncio)
-try:
-    import nest_asyncio
-    nest_asyncio.apply()
-    _NEST_ASYNCIO_APPLIED = True
-except ImportError:
-    _NEST_ASYNCIO_APPLIED = False
-
 from slidex.config import settings
 from slidex.logging_config import logger
 from slidex.core.audit_logger import audit_logger
@@ -37,6 +34,30 @@ class LightRAGClient:
         self._initialized = False
         self._event_loop = None
         self._loop_thread = None
+        self._init_lock = threading.Lock()
+        # One Ollama client (and HTTP keep-alive pool) per event loop, reused
+        # across embedding calls; lightrag's ollama_embed opens and closes a
+        # new client on every call
+        self._embed_clients = weakref.WeakKeyDictionary()
+    
+    def _get_embed_client(self) -> ollama.AsyncClient:
+        """Return the Ollama async client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._embed_clients.get(loop)
+        if client is None:
+            # Same headers as lightrag's ollama_embed, including the bearer
+            # token for authenticated or cloud Ollama endpoints
+            headers = {
+                "Content-Type": "application/json",
+                "User-Agent": f"LightRAG/{__api_version__}",
+            }
+            api_key = os.getenv("OLLAMA_API_KEY")
+            if api_key:
+                headers["Authorization"] = f"Bearer {api_key}"
+            client = ollama.AsyncClient(host=settings.ollama_base_url, headers=headers)
+            self._embed_clients[loop] = client
+        return client
+    
     async def _initialize_async(self) -> None:
         """Async initialization of LightRAG."""
         if self._initialized:
@@ -53,27 +74,31 @@ class LightRAGClient:
             """Embedding function with audit logging."""
             start_time = time.time()
             try:
-                # Call ollama_embed with host configuration
-                result = await ollama_embed(
-                    texts,
-                    embed_model=settings.ollama_embedding_model,
-                    host=settings.ollama_base_url
+                response = await self._get_embed_client().embed(
+                    model=settings.ollama_embedding_model,
+                    input=texts
                 )
+                result = response['embeddings']
                 
                 duration_ms = (time.time() - start_time) * 1000
                 
-                # Log to audit database
-                for text in texts:
-                    audit_logger.log_llm_call(
-                        model_name=settings.ollama_embedding_model,
-                        operation_type="embedding_lightrag",
-                        input_text=text[:500],
-                        output_text=f"Vector dimension: 768",
-                        metadata={"vector_dimension": 768},
-                        duration_ms=duration_ms / len(texts),
-                    )
+                # Log to audit database (one transaction for the whole batch)
+                audit_logger.log_llm_calls_batch([
+                    {
+                        "model_name": settings.ollama_embedding_model,
+                        "operation_type": "embedding_lightrag",
+                        "input_text": text[:500],
+                        "output_text": "Vector dimension: 768",
+                        "metadata": {"vector_dimension": 768},
+                        "duration_ms": duration_ms / len(texts),
+                    }
+                    for text in texts
+                ])
                 
-                return result
+                # Ollama returns float64 lists; the vector store works in
+                # float32 (and compresses to float16 on disk), so convert once
+                # here to halve the memory held for pending vectors
+                return np.asarray(result, dtype=np.float32)
             except Exception as e:
                 duration_ms = (time.time() - start_time) * 1000
                 logger.error(f"Error in LightRAG embedding: {e}")
@@ -210,10 +235,15 @@ class LightRAGClient:
     
     def initialize(self) -> None:
         """Synchronous wrapper for initialization."""
-        if not self._initialized:
+        if self._initialized:
+            return
+        # Concurrent ingests all get here lazily; the lock keeps them from
+        # each starting their own loop thread and LightRAG instance
+        with self._init_lock:
+            if self._initialized:
+                return
             # Create a dedicated event loop in a background thread for LightRAG
             # This ensures all LightRAG operations use the same event loop
-            import threading
             import queue
             
             result_queue = queue.Queue()
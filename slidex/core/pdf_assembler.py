@@ -1,7 +1,9 @@
 """PDF assembler for creating presentations from selected slides."""
 
+import os
+import tempfile
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 import fitz  # PyMuPDF
@@ -11,6 +13,12 @@ from slidex.logging_config import logger
 from slidex.core.database import db
 
 
+# Mode the export would get from a plain save() (mkstemp uses 0600)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_EXPORT_FILE_MODE = 0o666 & ~_UMASK
+
+
 class PDFAssembler:
     """Assembles selected slides into a PDF presentation."""
 
@@ -19,6 +27,7 @@ class PDFAssembler:
         slide_ids: List[str],
         output_filename: str | None = None,
         preserve_order: bool = False,
+        slides: Optional[List[dict]] = None,
     ) -> Path:
         """Assemble slides into a PDF presentation.
 
@@ -26,6 +35,8 @@ class PDFAssembler:
             slide_ids: List of slide IDs
             output_filename: Optional output filename
             preserve_order: Whether to preserve slide ID order
+            slides: Slide rows already fetched with db.get_slides_by_ids,
+                    in slide_ids order (skips the lookup)
 
         Returns:
             Path to assembled PDF
@@ -35,14 +46,14 @@ class PDFAssembler:
 
         logger.info(f"Assembling PDF with {len(slide_ids)} slides")
 
-        # Fetch slide metadata
-        slides_data: list[dict] = []
-        for slide_id in slide_ids:
-            slide = db.get_slide_by_id(slide_id)
-            if not slide:
-                logger.warning(f"Slide not found: {slide_id}")
-                continue
-            slides_data.append(slide)
+        # Fetch slide metadata (one query for all slides) unless preloaded
+        slides_data: list[dict] = (
+            slides if slides is not None else db.get_slides_by_ids(slide_ids)
+        )
+        if len(slides_data) < len(slide_ids):
+            logger.warning(
+                f"{len(slide_ids) - len(slides_data)} slide(s) not found, skipping"
+            )
 
         if not slides_data:
             raise ValueError("No valid slides found")
@@ -63,21 +74,27 @@ class PDFAssembler:
         for slide_data in ordered_slides:
             pdf_path = slide_data.get("slide_pdf_path")
 
-            if not pdf_path or not Path(pdf_path).exists():
+            if not pdf_path:
                 logger.warning(
                     f"PDF not found for slide {slide_data.get('slide_id')}, skipping"
                 )
                 continue
 
+            # Opening the file doubles as the existence check (no extra stat)
             try:
                 src_doc = fitz.open(str(pdf_path))
                 if src_doc.page_count > 0:
                     out_doc.insert_pdf(src_doc, from_page=0, to_page=0)
                     logger.debug(
-                        "Added slide: %s",
+                        "Added slide: {}",
                         slide_data.get("title_header") or "Untitled",
                     )
                 src_doc.close()
+            except (FileNotFoundError, fitz.FileNotFoundError):
+                logger.warning(
+                    f"PDF not found for slide {slide_data.get('slide_id')}, skipping"
+                )
+                continue
             except Exception as e:  # pragma: no cover - defensive
                 logger.error(
                     f"Error adding slide {slide_data.get('slide_id')} to PDF: {e}"
@@ -93,9 +110,20 @@ class PDFAssembler:
         output_path = settings.exports_dir / output_filename
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        out_doc.save(str(output_path))
-        page_count = out_doc.page_count
-        out_doc.close()
+        # Save to a temporary file and swap it into place atomically
+        fd, tmp_path = tempfile.mkstemp(
+            dir=output_path.parent, prefix=".", suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            out_doc.save(tmp_path)
+            page_count = out_doc.page_count
+            out_doc.close()
+            os.chmod(tmp_path, _EXPORT_FILE_MODE)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
 
         logger.info(f"PDF assembled: {output_path} ({page_count} pages)")
         return output_path
@@ -3,6 +3,7 @@ PDF processor for converting PowerPoint presentations to PDF
 and extracting individual slides as separate PDF files.
 """
 
+import queue
 import subprocess
 import shutil
 from pathlib import Path
@@ -14,6 +15,14 @@ import fitz  # PyMuPDF for all PDF operations (read/write/render)
 from slidex.config import settings
 from slidex.logging_config import logger
 
+# soffice instances sharing a user profile hand work off to each other (or
+# fail), so each concurrent conversion checks out its own profile directory.
+# The profiles persist, so LibreOffice's first-run profile setup is paid once
+# per slot rather than per conversion
+_soffice_profiles: "queue.Queue[Path]" = queue.Queue()
+for _slot in range(max(1, settings.libreoffice_pool_size)):
+    _soffice_profiles.put(settings.storage_root / "libreoffice_profiles" / str(_slot))
+
 
 class PDFProcessor:
     """Handles PDF conversion and page extraction for PowerPoint slides."""
@@ -95,19 +104,24 @@ class PDFProcessor:
         logger.debug(f"Converting {pptx_path} to PDF using LibreOffice")
         
         try:
-            # Run LibreOffice in headless mode
-            result = subprocess.run(
-                [
-                    str(soffice_path),
-                    "--headless",
-                    "--convert-to", "pdf",
-                    "--outdir", str(output_dir),
-                    str(pptx_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            # Run LibreOffice in headless mode with a profile from the pool
+            profile_dir = _soffice_profiles.get()
+            try:
+                result = subprocess.run(
+                    [
+                        str(soffice_path),
+                        f"-env:UserInstallation={profile_dir.resolve().as_uri()}",
+                        "--headless",
+                        "--convert-to", "pdf",
+                        "--outdir", str(output_dir),
+                        str(pptx_path)
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+            finally:
+                _soffice_profiles.put(profile_dir)
             
             if result.returncode != 0:
                 logger.error(f"LibreOffice conversion failed: {result.stderr}")
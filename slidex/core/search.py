@@ -3,6 +3,7 @@ Search engine for semantic slide search using LightRAG.
 """
 
 from typing import List, Dict, Any, Optional, Literal
+import asyncio
 import re
 import traceback
 
@@ -37,7 +38,7 @@ class SearchEngine:
         if top_k is None:
             top_k = settings.top_k_results
         
-        logger.info(f"Searching for: '{query}' (top_k={top_k}, mode={mode})")
+        logger.info("Searching for: '{}' (top_k={}, mode={})", query, top_k, mode)
         
         try:
             return await SearchEngine._search_with_lightrag(query, top_k, mode)
@@ -90,7 +91,7 @@ class SearchEngine:
                 raise
             
             # Convert context to string if needed
-            logger.debug(f"Converting context to string")
+            logger.debug("Converting context to string")
             if hasattr(context, 'text'):
                 context = str(context.text)
             elif hasattr(context, '__str__'):
@@ -98,42 +99,36 @@ class SearchEngine:
             else:
                 context = str(context)
             
-            logger.debug(f"LightRAG query completed, context length: {len(context) if context else 0}")
+            logger.debug("LightRAG query completed, context length: {}", len(context) if context else 0)
 
             
             if not context:
                 logger.info("No context from LightRAG")
                 return {'results': [], 'response': None}
             
-            logger.debug(f"LightRAG context length: {len(context)}")
+            logger.debug("LightRAG context length: {}", len(context))
             
             # Step 2: Extract [SLIDE_ID:uuid] markers from context
             logger.debug("Extracting slide IDs from context markers")
             marker_pattern = r'\[SLIDE_ID:([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})\]'
-            slide_ids = re.findall(marker_pattern, context, re.IGNORECASE)
-            logger.debug(f"Found {len(slide_ids)} slide IDs in pattern")
             
-            if not slide_ids:
-                logger.warning("No slide IDs found in LightRAG context")
-                return {'results': [], 'response': None}
-            
-            logger.info(f"Extracted {len(slide_ids)} slide IDs from context markers")
-            
-            # Remove duplicates while preserving order
-            logger.debug("Removing duplicate slide IDs")
+            # Dedup (preserving order) and limit to top_k in a single pass
+            # over the matches, stopping the scan once top_k ids are found
             seen = set()
             unique_slide_ids = []
-            for sid in slide_ids:
-                sid_lower = sid.lower()
+            for match in re.finditer(marker_pattern, context, re.IGNORECASE):
+                if len(unique_slide_ids) >= top_k:
+                    break
+                sid_lower = match.group(1).lower()
                 if sid_lower not in seen:
                     seen.add(sid_lower)
                     unique_slide_ids.append(sid_lower)
             
-            # Limit to top_k
-            unique_slide_ids = unique_slide_ids[:top_k]
-            logger.debug(f"After dedup and limiting: {len(unique_slide_ids)} unique slide IDs")
+            if not unique_slide_ids:
+                logger.warning("No slide IDs found in LightRAG context")
+                return {'results': [], 'response': None}
             
-            logger.info(f"Found {len(unique_slide_ids)} unique slide IDs from LightRAG")
+            logger.info("Found {} unique slide IDs from LightRAG", len(unique_slide_ids))
             
             # Step 3: Generate natural language response from LightRAG
             logger.debug("Generating natural language answer from LightRAG")
@@ -155,17 +150,20 @@ class SearchEngine:
                     response_text = str(answer)
                 else:
                     response_text = str(answer)
-                logger.debug(f"Generated answer length: {len(response_text)}")
+                logger.debug("Generated answer length: {}", len(response_text))
             except Exception as e:
                 logger.warning(f"Failed to generate answer: {e}")
                 response_text = f"Found {len(unique_slide_ids)} relevant slides matching your query: '{query}'"
             
             # Step 4: Retrieve slide metadata from database
             logger.debug("Retrieving slide metadata from database")
+            # Blocking database I/O runs in a worker thread so concurrent
+            # requests keep being served while it waits
+            slides = await asyncio.to_thread(db.get_slides_by_ids, unique_slide_ids)
+            slides_by_id = {str(slide['slide_id']): slide for slide in slides}
             results = []
             for idx, slide_id in enumerate(unique_slide_ids):
-                logger.debug(f"Fetching slide {idx+1}/{len(unique_slide_ids)}: {slide_id}")
-                slide = db.get_slide_by_id(slide_id)
+                slide = slides_by_id.get(slide_id)
                 if slide:
                     # Assign score based on position (earlier = higher score)
                     score = 1.0 - (idx / len(unique_slide_ids)) if len(unique_slide_ids) > 1 else 1.0
@@ -193,7 +191,7 @@ class SearchEngine:
                     'response': None
                 }
             
-            logger.info(f"Returning {len(results)} search results from LightRAG")
+            logger.info("Returning {} search results from LightRAG", len(results))
             return {
                 'results': results,
                 'response': response_text
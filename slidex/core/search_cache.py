@@ -0,0 +1,167 @@
+"""
+Semantic cache for search results.
+A query whose embedding is close enough to one answered before gets the
+earlier result back, skipping the LightRAG query and answer generation.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from slidex.config import settings
+from slidex.logging_config import logger
+
+
+# Queries that differ only in numbers ("Q3 revenue" vs "Q4 revenue") embed
+# almost identically, so they are never answered from the cache
+_DIGIT_RE = re.compile(r"\d")
+
+
+class SemanticCache:
+    """In-memory cache of search results keyed by query embedding similarity."""
+
+    def __init__(self, max_entries: int, threshold: float, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached queries (least recently
+                used entries are evicted first)
+            threshold: Minimum cosine similarity for a cache hit
+            ttl_seconds: Lifetime of an entry; data_version only tracks
+                ingests made by this process, so changes made by the CLI,
+                other workers or clean_data.py are picked up on expiry
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        """Drop every entry."""
+        self._embeddings: Optional[np.ndarray] = None  # (max_entries, dim), L2-normalized
+        self._keys: List[Tuple[int, str]] = []
+        self._results: List[Dict[str, Any]] = []
+        self._last_used: List[int] = []
+        self._expires_at: List[float] = []
+        self._clock = 0
+        self._data_version: Optional[int] = None
+
+    @staticmethod
+    def is_cacheable(query: str) -> bool:
+        """Whether a query may be served from (and stored in) the cache."""
+        return not _DIGIT_RE.search(query)
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _sync_version(self, data_version: int) -> None:
+        """Invalidate everything once new slides have been ingested."""
+        if self._data_version != data_version:
+            self._clear()
+            self._data_version = data_version
+
+    def lookup(
+        self,
+        embedding: Sequence[float],
+        top_k: int,
+        mode: str,
+        data_version: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached result for a semantically similar query.
+
+        Args:
+            embedding: Embedding of the incoming query
+            top_k: Requested number of results
+            mode: LightRAG query mode
+            data_version: Current ingest generation (IngestEngine.data_version)
+
+        Returns:
+            The cached search result, or None on a miss
+        """
+        query_vector = self._normalize(embedding)
+
+        with self._lock:
+            self._sync_version(data_version)
+            count = len(self._keys)
+            if count == 0 or self._embeddings.shape[1] != query_vector.shape[0]:
+                return None
+
+            now = time.monotonic()
+            similarities = self._embeddings[:count] @ query_vector
+            key = (top_k, mode)
+            for idx in np.argsort(similarities)[::-1]:
+                if similarities[idx] < self.threshold:
+                    break
+                if self._keys[idx] == key and self._expires_at[idx] > now:
+                    self._clock += 1
+                    self._last_used[idx] = self._clock
+                    logger.debug("Search cache hit (similarity={:.4f})", float(similarities[idx]))
+                    return self._results[idx]
+
+        return None
+
+    def insert(
+        self,
+        embedding: Sequence[float],
+        top_k: int,
+        mode: str,
+        result: Dict[str, Any],
+        data_version: int
+    ) -> None:
+        """
+        Store a search result under its query embedding.
+
+        Args:
+            embedding: Embedding of the query
+            top_k: Requested number of results
+            mode: LightRAG query mode
+            result: Search result to return for similar queries
+            data_version: Ingest generation the result was computed against
+        """
+        if self.max_entries <= 0:
+            return
+
+        query_vector = self._normalize(embedding)
+
+        with self._lock:
+            self._sync_version(data_version)
+            if self._embeddings is None or self._embeddings.shape[1] != query_vector.shape[0]:
+                # First entry, or the embedding model changed
+                self._clear()
+                self._data_version = data_version
+                self._embeddings = np.empty(
+                    (self.max_entries, query_vector.shape[0]), dtype=np.float32
+                )
+
+            self._clock += 1
+            expires_at = time.monotonic() + self.ttl_seconds
+            if len(self._keys) < self.max_entries:
+                idx = len(self._keys)
+                self._keys.append((top_k, mode))
+                self._results.append(result)
+                self._last_used.append(self._clock)
+                self._expires_at.append(expires_at)
+            else:
+                idx = int(np.argmin(self._last_used))
+                self._keys[idx] = (top_k, mode)
+                self._results[idx] = result
+                self._last_used[idx] = self._clock
+                self._expires_at[idx] = expires_at
+            self._embeddings[idx] = query_vector
+
+
+# Global search cache instance
+search_cache = SemanticCache(
+    max_entries=settings.search_cache_max_entries,
+    threshold=settings.search_cache_similarity_threshold,
+    ttl_seconds=settings.search_cache_ttl_seconds,
+)
@@ -164,7 +164,7 @@ class SlideProcessor:
                 if img is not None:
                     img.save(output_path, "PNG")
                     logger.debug(
-                        f"PDF-based thumbnail generated: {output_path} (page {slide_index})"
+                        "PDF-based thumbnail generated: {} (page {})", output_path, slide_index
                     )
                     return
             except Exception as e:  # pragma: no cover - defensive
@@ -292,7 +292,7 @@ class SlideProcessor:
             
             # Save thumbnail
             img.save(output_path, 'PNG')
-            logger.debug(f"Pillow thumbnail generated: {output_path} (images: {images_drawn})")
+            logger.debug("Pillow thumbnail generated: {} (images: {})", output_path, images_drawn)
         
         except Exception as e:
             logger.error(f"Error generating Pillow thumbnail for slide {slide_index}: {e}")
@@ -422,7 +422,7 @@ class SlideProcessor:
             
             # Save the single-slide presentation
             new_prs.save(str(output_path))
-            logger.debug(f"Saved individual slide file: {output_path}")
+            logger.debug("Saved individual slide file: {}", output_path)
             
         except Exception as e:
             logger.error(f"Error saving slide as file: {e}")
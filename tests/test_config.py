@@ -49,7 +49,17 @@ def test_settings_ensure_directories(tmp_path):
     
     # Check that directories were created
     assert settings.storage_root.exists()
+    assert settings.storage_root.is_absolute()
     assert settings.thumbnails_dir.exists()
     assert settings.slides_dir.exists()
     assert settings.exports_dir.exists()
     assert settings.audit_db_path.parent.exists()
+
+
+def test_settings_storage_dirs_created_on_first_use(tmp_path):
+    """Test that storage directories are only created when accessed."""
+    settings = Settings(storage_root=tmp_path / "lazy_storage")
+    assert not settings.storage_root.exists()
+    
+    assert settings.exports_dir.is_dir()
+    assert not (settings.storage_root / "thumbnails").exists()
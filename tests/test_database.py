@@ -0,0 +1,21 @@
+"""
+Tests for database helpers that don't require a running PostgreSQL.
+"""
+
+from slidex.core.database import _copy_text_value
+
+
+def test_copy_text_value_null_and_bool():
+    """Test that NULLs and booleans use COPY text representations."""
+    assert _copy_text_value(None) == "\\N"
+    assert _copy_text_value(True) == "t"
+    assert _copy_text_value(False) == "f"
+    assert _copy_text_value(0) == "0"
+
+
+def test_copy_text_value_escapes_delimiters():
+    """Test that tabs, newlines and backslashes are escaped."""
+    assert _copy_text_value("a\tb") == "a\\tb"
+    assert _copy_text_value("line1\nline2\r") == "line1\\nline2\\r"
+    assert _copy_text_value("C:\\path") == "C:\\\\path"
+    assert _copy_text_value("\\N") == "\\\\N"
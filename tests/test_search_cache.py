@@ -0,0 +1,50 @@
+"""
+Tests for the semantic search cache.
+"""
+
+from slidex.core import search_cache
+from slidex.core.search_cache import SemanticCache
+
+
+def test_similar_query_hits_and_version_bump_invalidates():
+    """Test that near-identical embeddings hit and a new ingest clears the cache."""
+    cache = SemanticCache(max_entries=10, threshold=0.95, ttl_seconds=60)
+    result = {"results": [{"slide_id": "a"}], "response": None}
+    cache.insert([1.0, 0.0, 0.0], 10, "hybrid", result, data_version=1)
+
+    assert cache.lookup([0.99, 0.05, 0.0], 10, "hybrid", data_version=1) is result
+    assert cache.lookup([0.0, 1.0, 0.0], 10, "hybrid", data_version=1) is None
+    assert cache.lookup([1.0, 0.0, 0.0], 5, "hybrid", data_version=1) is None
+    assert cache.lookup([1.0, 0.0, 0.0], 10, "hybrid", data_version=2) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test that the cache keeps at most max_entries queries."""
+    cache = SemanticCache(max_entries=2, threshold=0.95, ttl_seconds=60)
+    cache.insert([1.0, 0.0], 10, "hybrid", {"q": "a"}, data_version=1)
+    cache.insert([0.0, 1.0], 10, "hybrid", {"q": "b"}, data_version=1)
+    cache.lookup([1.0, 0.0], 10, "hybrid", data_version=1)  # refresh "a"
+    cache.insert([-1.0, 0.0], 10, "hybrid", {"q": "c"}, data_version=1)
+
+    assert cache.lookup([1.0, 0.0], 10, "hybrid", data_version=1) == {"q": "a"}
+    assert cache.lookup([0.0, 1.0], 10, "hybrid", data_version=1) is None
+    assert cache.lookup([-1.0, 0.0], 10, "hybrid", data_version=1) == {"q": "c"}
+
+
+def test_queries_with_digits_are_not_cacheable():
+    """Test that numeric queries bypass the cache."""
+    assert SemanticCache.is_cacheable("revenue by region")
+    assert not SemanticCache.is_cacheable("Q3 revenue")
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    """Test that entries stop hitting once their TTL has passed."""
+    now = [1000.0]
+    monkeypatch.setattr(search_cache.time, "monotonic", lambda: now[0])
+    cache = SemanticCache(max_entries=10, threshold=0.95, ttl_seconds=60)
+    cache.insert([1.0, 0.0], 10, "hybrid", {"q": "a"}, data_version=1)
+
+    now[0] += 59
+    assert cache.lookup([1.0, 0.0], 10, "hybrid", data_version=1) == {"q": "a"}
+    now[0] += 2
+    assert cache.lookup([1.0, 0.0], 10, "hybrid", data_version=1) is None